@@ -1,8 +1,12 @@
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 from .categories import CATEGORIES
 import taskrabbit_parser as trp  # import top-level script containing TaskRabbitParser
 
+logger = logging.getLogger(__name__)
+
 
 def run_parser_for_category(category: str, headless: bool = False, max_pages: Optional[int] = None) -> str:
     """Run the parser for a specific category and return CSV filename."""
@@ -11,16 +15,27 @@ def run_parser_for_category(category: str, headless: bool = False, max_pages: Op
     return parser.csv_filename
 
 
-def run_all_categories(headless: bool = False, max_pages: Optional[int] = None) -> Dict[str, Optional[str]]:
-    """Run the parser for all configured categories and return mapping to CSV paths (or None on failure)."""
-    results: Dict[str, Optional[str]] = {}
-    for category in CATEGORIES.keys():
+def run_all_categories(headless: bool = False, max_pages: Optional[int] = None,
+                       workers: Optional[int] = None) -> Dict[str, Optional[str]]:
+    """Run the parser for all configured categories and return mapping to CSV paths (or None on failure).
+
+    Categories are independent, so up to `workers` of them run at once, each on a browser
+    from the shared pool; extra categories queue for a free browser. The default is
+    BROWSER_POOL_SIZE in headless mode and 1 (one visible window at a time) otherwise.
+    A failing category is logged and reported as None without stopping the others.
+    """
+    if workers is None:
+        workers = trp.BROWSER_POOL_SIZE if headless else 1
+    def run_one(category: str) -> Optional[str]:
         try:
-            csv_file = run_parser_for_category(category, headless, max_pages)
-            results[category] = csv_file
-        except Exception:
-            results[category] = None
-    return results
+            return run_parser_for_category(category, headless, max_pages)
+        except Exception as e:
+            logger.error(f"{CATEGORIES[category]['name']} failed: {e}")
+            return None
+
+    categories = list(CATEGORIES.keys())
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return dict(zip(categories, executor.map(run_one, categories)))
 
 
 def interactive_category_selection() -> Optional[str]:
@@ -1,8 +1,37 @@
 from typing import List, Tuple
-from selenium.webdriver.common.by import By
 import logging
-from .selectors import NAME_SELECTORS_VISIBLE_SCAN, RATE_SELECTORS_VISIBLE_SCAN
+import re
+from .selectors import NAME_VISIBLE_SCAN_LOCATORS, RATE_VISIBLE_SCAN_LOCATORS
 
+# Words that disqualify a visible text from being a tasker name
+_NON_NAME_KEYWORDS = ('select', 'continue', 'read', 'more', 'book', 'view', 'how', 'help', 'about', 'task', 'review', 'experience')
+_NON_NAME_KEYWORDS_RE = re.compile('|'.join(map(re.escape, _NON_NAME_KEYWORDS)), re.IGNORECASE)
+
+# Returns, for each list of (By, value) locators in arguments[0], the trimmed innerText of
+# every visible element they match ('css selector' via querySelectorAll, otherwise XPath)
+VISIBLE_TEXTS_JS = """
+function isVisible(e) {
+    if (!e.getClientRects().length) return false;
+    var style = window.getComputedStyle(e);
+    return style.visibility !== 'hidden' && style.opacity !== '0';
+}
+function findAll(locator) {
+    if (locator[0] === 'css selector') return Array.prototype.slice.call(document.querySelectorAll(locator[1]));
+    var nodes = [];
+    var result = document.evaluate(locator[1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+    return nodes;
+}
+return arguments[0].map(function (locators) {
+    var texts = [];
+    locators.forEach(function (locator) {
+        findAll(locator).forEach(function (node) {
+            if (node.nodeType === 1 && isVisible(node)) texts.push((node.innerText || '').trim());
+        });
+    });
+    return texts;
+});
+"""
 
 def extract_all_visible_text(ctx) -> Tuple[List[str], List[str]]:
     """Extract all visible potential names and rate strings on the current page.
@@ -12,42 +41,41 @@ def extract_all_visible_text(ctx) -> Tuple[List[str], List[str]]:
     driver = ctx.driver
 
     logger.debug("Extracting all visible text...")
-    potential_names: List[str] = []
-    rates: List[str] = []
+    try:
+        name_texts, rate_texts = driver.execute_script(
+            VISIBLE_TEXTS_JS, [NAME_VISIBLE_SCAN_LOCATORS, RATE_VISIBLE_SCAN_LOCATORS]
+        )
+    except Exception as e:
+        logger.debug(f"Batched visible text scan failed, querying elements one by one: {e}")
+        name_texts = _visible_texts(driver, NAME_VISIBLE_SCAN_LOCATORS)
+        rate_texts = _visible_texts(driver, RATE_VISIBLE_SCAN_LOCATORS)
+
+    # Deduplicate first, so each distinct text is validated once
+    potential_names: List[str] = [
+        text for text in set(name_texts)
+        if (
+            text and '.' in text and len(text) < 50 and len(text.split()) <= 3
+            and any(c.isalpha() for c in text)
+            and not _NON_NAME_KEYWORDS_RE.search(text)
+        )
+    ]
+    rates: List[str] = [
+        text for text in set(rate_texts)
+        if '$' in text and '/hr' in text and len(text) < 20
+    ]
+
+    logger.info(f"Extracted {len(potential_names)} potential names and {len(rates)} rates")
+    return potential_names, rates
 
-    # Names
-    for selector in NAME_SELECTORS_VISIBLE_SCAN:
-        try:
-            name_elements = driver.find_elements(By.XPATH, selector)
-            for element in name_elements:
-                if element.is_displayed():
-                    text = (element.text or '').strip()
-                    if (
-                        text and '.' in text and len(text) < 50 and len(text.split()) <= 3
-                        and any(c.isalpha() for c in text)
-                        and not any(k in text.lower() for k in ['select', 'continue', 'read', 'more', 'book', 'view', 'how', 'help', 'about', 'task', 'review', 'experience'])
-                    ):
-                        potential_names.append(text)
-        except Exception as e:
-            logger.debug(f"Error extracting names with selector {selector}: {e}")
-            continue
 
-    # Rates
-    for selector in RATE_SELECTORS_VISIBLE_SCAN:
+def _visible_texts(driver, locators: List[Tuple[str, str]]) -> List[str]:
+    """Texts of the displayed elements matching any of `locators` (slow per-element path)."""
+    texts: List[str] = []
+    for locator in locators:
         try:
-            rate_elements = driver.find_elements(By.XPATH, selector)
-            for element in rate_elements:
+            for element in driver.find_elements(*locator):
                 if element.is_displayed():
-                    text = (element.text or '').strip()
-                    if '$' in text and '/hr' in text and len(text) < 20:
-                        rates.append(text)
+                    texts.append((element.text or '').strip())
         except Exception as e:
-            logger.debug(f"Error extracting rates with selector {selector}: {e}")
-            continue
-
-    # Deduplicate
-    potential_names = list(set(potential_names))
-    rates = list(set(rates))
-
-    logger.info(f"Extracted {len(potential_names)} potential names and {len(rates)} rates")
-    return potential_names, rates
+            logging.getLogger(__name__).debug(f"Error extracting visible text with selector {locator[1]}: {e}")
+    return texts
@@ -0,0 +1,120 @@
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+
+class DriverPool:
+    """Bounded pool of warm WebDriver instances.
+
+    Browsers are created lazily by `factory` (up to `size`) and handed back to the
+    pool after each use instead of being quit, so workers navigate an already
+    running browser rather than cold-starting Chrome for every page.
+
+    `reset` (optional) is applied to a driver on release to clear per-use state; a
+    driver whose reset fails is quit instead of reused. With `max_uses`, a driver
+    is quit after that many uses and its slot refilled by a fresh browser on demand.
+
+    `dispose` (optional) replaces driver.quit() for drivers leaving the pool, e.g. to
+    hand browsers borrowed from another pool back to it.
+    """
+
+    def __init__(self, factory: Callable, size: int, reset: Optional[Callable] = None,
+                 max_uses: Optional[int] = None, dispose: Optional[Callable] = None):
+        self.size = size
+        self._factory = factory
+        self._reset = reset
+        self._max_uses = max_uses
+        self._dispose = dispose
+        self._uses: Dict[int, int] = {}
+        self._idle: queue.Queue = queue.Queue()
+        self._created: List = []
+        self._lock = threading.Lock()
+
+    def grow(self, size: int) -> None:
+        """Raise the pool's capacity to at least `size` browsers (it never shrinks)."""
+        with self._lock:
+            self.size = max(self.size, size)
+
+    def acquire(self):
+        """Return an idle driver, creating one if the pool is not full, else wait for one to be released."""
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                can_create = len(self._created) < self.size
+                if can_create:
+                    # Reserve the slot before the (slow) browser start so other workers wait instead
+                    self._created.append(None)
+            if can_create:
+                return self._create()
+            try:
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                # Re-check: a slot may have been freed by a failed browser start
+                continue
+
+    def _create(self):
+        try:
+            driver = self._factory()
+        except Exception:
+            with self._lock:
+                self._created.remove(None)
+            raise
+        with self._lock:
+            self._created[self._created.index(None)] = driver
+        return driver
+
+    def release(self, driver) -> None:
+        """Return a driver to the pool for reuse, or retire it once it has been used `max_uses` times."""
+        with self._lock:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+        if self._max_uses is not None and uses >= self._max_uses:
+            self._discard(driver)
+            return
+        if self._reset is not None:
+            try:
+                self._reset(driver)
+            except Exception:
+                self._discard(driver)
+                return
+        self._idle.put(driver)
+
+    def _discard(self, driver) -> None:
+        """Quit (or dispose of) `driver` and free its slot."""
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            if driver in self._created:
+                self._created.remove(driver)
+        self._quit(driver)
+
+    def _quit(self, driver) -> None:
+        try:
+            if self._dispose is not None:
+                self._dispose(driver)
+            else:
+                driver.quit()
+        except Exception:
+            pass
+
+    @contextmanager
+    def driver(self):
+        """Context manager yielding a pooled driver and releasing it afterwards."""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self) -> None:
+        """Quit (or dispose of) every browser the pool has created."""
+        with self._lock:
+            drivers = [driver for driver in self._created if driver is not None]
+            self._created = []
+            self._uses = {}
+        for driver in drivers:
+            self._quit(driver)
+        self._idle = queue.Queue()
@@ -1,20 +1,503 @@
-import time
 import re
-from typing import List, Dict
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 from selenium.webdriver.common.by import By
-from .selectors import NAME_SELECTORS_CARD, RATE_SELECTORS_CARD
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from .pool import DriverPool
+from .selectors import (
+    NAME_SELECTORS_CARD,
+    RATE_SELECTORS_CARD,
+    MUI_PAGINATION_SELECTORS,
+    PAGINATION_SELECTORS,
+    PAGINATION_TEXT_SELECTORS,
+    PAGE_LINK_SELECTORS,
+    NEXT_PAGE_COMPOUND_SELECTORS,
+    TASKER_CARD_ATTR,
+    TASKER_CARD_CSS,
+    TASKER_CARD_FALLBACK_CSS,
+)
 
 # This module contains the scraping and pagination helpers extracted from TaskRabbitParser.
 # Each function accepts `ctx`, which is the TaskRabbitParser instance, so it can
 # access `driver`, `wait`, constants (SLEEP_*), and helper methods like
 # `is_potential_name()` and `is_valid_person_name()`.
 
+# Name patterns for the card text/HTML fallbacks, compiled once per process
+_CARD_TEXT_NAME_RE = re.compile(r"\b[A-Z][a-z]+ [A-Z]\.|\b[A-Z][A-Z]+ [A-Z]\.")
+_CARD_HTML_NAME_RE = re.compile(
+    r">([A-Za-z][a-z]+(?:\s+[A-Za-z][a-z]+)*\s+[A-Z]\.)<|>([A-Z][A-Z]+(?:\s+[A-Z][A-Z]+)*\s+[A-Z]\.)<"
+)
+
+# Rate patterns, anchored at a '$' located by find_price() rather than searched for
+_HOURLY_RATE_RE = re.compile(r"\$\d+(?:\.\d+)?/hr")
+_DECIMAL_PRICE_RE = re.compile(r"\$(\d+\.\d+)")
+
+# Card detail patterns, compiled once instead of on every card
+_REVIEW_RE = re.compile(r"(\d+\.\d+)\s*\((\d+)\s*review")
+_FURNITURE_TASKS_RE = re.compile(r"(\d+)\s+Furniture Assembly tasks")
+# Tried in order: the first one that matches gives the overall task count
+_OVERALL_TASKS_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"(\d+)\s+Assembly tasks overall",
+    r"(\d+)\s+tasks overall",
+    r"(\d+)\s+overall tasks",
+    r"(\d+)\s+total tasks",
+    r"(\d+)\s+tasks completed",
+))
+# Flags only need to know whether any variant occurs, so the variants share one pattern
+_TWO_HOUR_MINIMUM_RE = re.compile(
+    r"2\s*Hour\s*Minimum|2\s*hr\s*minimum|2\s*hour\s*min|minimum\s*2\s*hour|min\s*2\s*hr", re.IGNORECASE
+)
+_ELITE_RE = re.compile(r"\b(?:Elite|ELITE|elite)\b")
+
+# `page` query parameter in pagination hrefs
+_PAGE_RE = re.compile(r"[?&]page=(\d+)")
+
+# "More results" phrases checked by check_for_next_page as its last resort
+_MORE_RE = re.compile(r"show more|load more|next page|page 2|more results", re.IGNORECASE)
+
+# "of N pages" in the page text, the last resort after the page-specific patterns below
+_OF_PAGES_RE = re.compile(r"of (\d+) pages?", re.IGNORECASE)
+
+# Wait condition for the primary tasker card; conditions are stateless, so one instance serves every wait
+CARDS_PRESENT = EC.presence_of_element_located((By.CSS_SELECTOR, TASKER_CARD_CSS))
+
+# Tasker cards read per listing page
+MAX_CARDS_PER_PAGE = 15
+
+# (tag, text, class, id, href, displayed, enabled) for one element matched by scan_elements()
+ElementInfo = Tuple[str, str, str, str, str, bool, bool]
+
+# (card text, card innerHTML, visible name texts per selector, visible rate texts per selector);
+# the per-selector texts are iterated once, in selector order
+CardSnapshot = Tuple[str, str, Iterable[List[str]], Iterable[List[str]]]
+
+# Shared by the scripts below: findAll(root, [by, value]) resolves a Selenium-style
+# locator under `root` ('css selector' via querySelectorAll, anything else as XPath).
+# XPaths are compiled once per script call and reused for every root (e.g. every card).
+_FIND_ALL_JS = """
+var compiledXPaths = {};
+function findAll(root, locator) {
+    if (locator[0] === 'css selector') return Array.prototype.slice.call(root.querySelectorAll(locator[1]));
+    var expression = compiledXPaths[locator[1]];
+    if (!expression) expression = compiledXPaths[locator[1]] = document.createExpression(locator[1], null);
+    var result = expression.evaluate(root, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < result.snapshotLength; i++) {
+        var node = result.snapshotItem(i);
+        if (node.nodeType === 1) nodes.push(node);
+    }
+    return nodes;
+}
+function isVisible(e) {
+    if (!e.getClientRects().length) return false;
+    var style = window.getComputedStyle(e);
+    return style.visibility !== 'hidden' && style.opacity !== '0';
+}
+"""
+
+# Shared by the card scripts below: snapshotCard(card, nameLocators, rateLocators) returns
+# [innerText, innerHTML, nameTexts, rateTexts], where nameTexts/rateTexts hold, for each
+# locator (in order), the texts of the visible elements it matches inside the card.
+# The CSS locators of both lists are run as one union query and bucketed with matches();
+# each node's visibility and text are read once even when several locators match it.
+_SNAPSHOT_CARD_JS = _FIND_ALL_JS + """
+function snapshotCard(card, nameLocators, rateLocators) {
+    nameLocators = nameLocators || [];
+    rateLocators = rateLocators || [];
+    var locators = nameLocators.concat(rateLocators);
+    var css = locators.filter(function (l) { return l[0] === 'css selector'; }).map(function (l) { return l[1]; });
+    var cssNodes = css.length ? Array.prototype.slice.call(card.querySelectorAll(css.join(', '))) : [];
+    var seen = new Map();
+    function text(node) {
+        if (!seen.has(node)) seen.set(node, isVisible(node) ? (node.innerText || '') : null);
+        return seen.get(node);
+    }
+    var texts = locators.map(function (locator) {
+        var nodes = locator[0] === 'css selector'
+            ? cssNodes.filter(function (node) { return node.matches(locator[1]); })
+            : findAll(card, locator);
+        return nodes.map(text).filter(function (t) { return t !== null; });
+    });
+    return [
+        card.innerText || '',
+        card.innerHTML || '',
+        texts.slice(0, nameLocators.length),
+        texts.slice(nameLocators.length)
+    ];
+}
+"""
+
+# Returns the snapshotCard() of each card passed in arguments[0], using the name/rate
+# locators in arguments[1]/arguments[2].
+CARD_SNAPSHOT_JS = _SNAPSHOT_CARD_JS + """
+var nameLocators = arguments[1];
+var rateLocators = arguments[2];
+return arguments[0].map(function (card) { return snapshotCard(card, nameLocators, rateLocators); });
+"""
+
+# Finds the tasker cards with the first CSS selector in arguments[0] that matches any and
+# returns [selectorIndex, cardCount, snapshots] with the snapshotCard() of at most
+# arguments[1] of them (name/rate locators in arguments[2]/arguments[3]), or
+# [-1, 0, []] when no selector matches.
+PAGE_CARDS_SNAPSHOT_JS = _SNAPSHOT_CARD_JS + """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    var cards = document.querySelectorAll(selectors[i]);
+    if (!cards.length) continue;
+    var snapshots = [];
+    for (var j = 0; j < cards.length && j < arguments[1]; j++) {
+        snapshots.push(snapshotCard(cards[j], arguments[2], arguments[3]));
+    }
+    return [i, cards.length, snapshots];
+}
+return [-1, 0, []];
+"""
+
+# Shared by ELEMENT_SCAN_JS and ELEMENT_PROPS_JS: describe(node) returns the ElementInfo
+# fields [tag, text, class, id, href, displayed, enabled] of one element.
+_DESCRIBE_JS = """
+function describe(node) {
+    var visible = isVisible(node);
+    return [
+        node.tagName.toLowerCase(),
+        visible ? (node.innerText || '').trim() : '',
+        node.getAttribute('class') || '',
+        node.getAttribute('id') || '',
+        node.href || node.getAttribute('href') || '',
+        visible,
+        !node.disabled
+    ];
+}
+"""
+
+# Returns [matchCount, elements] for each page-level locator in arguments[0].
+# elements describes the first arguments[1] matches (all of them when arguments[1] is 0);
+# when arguments[2] is true, hidden matches are dropped before they are described.
+ELEMENT_SCAN_JS = _FIND_ALL_JS + _DESCRIBE_JS + """
+var limit = arguments[1] || 0;
+var visibleOnly = arguments[2];
+return arguments[0].map(function (locator) {
+    var nodes;
+    try {
+        nodes = findAll(document, locator);
+    } catch (err) {
+        return [0, []];
+    }
+    var shown = visibleOnly ? nodes.filter(isVisible) : nodes;
+    return [nodes.length, (limit ? shown.slice(0, limit) : shown).map(describe)];
+});
+"""
+
+# Returns the ElementInfo fields of each WebElement passed in arguments[0].
+ELEMENT_PROPS_JS = _FIND_ALL_JS + _DESCRIBE_JS + """
+return arguments[0].map(describe);
+"""
+
+# Returns [kind, element, selector] for every clickable control leading to page arguments[0]:
+# first the MUI pagination buttons whose own text is the page number ('mui'), then the
+# matches of the link locators in arguments[1], in order ('link'). Hidden, disabled and
+# current-page controls are left out.
+PAGE_BUTTON_CANDIDATES_JS = _FIND_ALL_JS + """
+var page = String(arguments[0]);
+var muiSelector = "button[class*='MuiPaginationItem-page'], button[class*='MuiPaginationItem-root']";
+function usable(e, skipClasses) {
+    if (!isVisible(e) || e.disabled || e.getAttribute('aria-current') === 'page') return false;
+    var cls = (e.getAttribute('class') || '').toLowerCase();
+    return !skipClasses.some(function (word) { return cls.indexOf(word) !== -1; });
+}
+function hasOwnText(e, text) {
+    for (var n = e.firstChild; n; n = n.nextSibling) {
+        if (n.nodeType === 3 && n.nodeValue === text) return true;
+    }
+    return false;
+}
+var candidates = [];
+findAll(document, ['css selector', muiSelector]).forEach(function (e) {
+    if (hasOwnText(e, page) && usable(e, ['selected', 'current', 'active'])) candidates.push(['mui', e, muiSelector]);
+});
+arguments[1].forEach(function (locator) {
+    findAll(document, locator).forEach(function (e) {
+        if (usable(e, ['disabled', 'current', 'active'])) candidates.push(['link', e, locator[1]]);
+    });
+});
+return candidates;
+"""
+
+# Returns true once the listing shows page arguments[0]: the URL's page parameter matches,
+# or a selected (or aria-current) MUI pagination button has the page number as its own text.
+PAGE_REACHED_JS = """
+var page = String(arguments[0]);
+var match = /[?&]page=(\\d+)/.exec(location.href);
+if (match && Number(match[1]) === arguments[0]) return true;
+return Array.prototype.some.call(document.querySelectorAll("button[class*='MuiPaginationItem']"), function (e) {
+    var cls = e.getAttribute('class') || '';
+    if (cls.indexOf('selected') === -1 && e.getAttribute('aria-current') !== 'page') return false;
+    for (var n = e.firstChild; n; n = n.nextSibling) {
+        if (n.nodeType === 3 && n.nodeValue === page) return true;
+    }
+    return false;
+});
+"""
+
+# Returns true once the page loaded by URL shows tasker cards matching arguments[1] and, if it
+# renders a selected MUI pagination button, that button is page arguments[0] (so a listing
+# that ignores the page parameter is not mistaken for the requested page).
+URL_PAGE_READY_JS = """
+var page = String(arguments[0]);
+if (!document.querySelector(arguments[1])) return false;
+var selected = Array.prototype.filter.call(document.querySelectorAll("button[class*='MuiPaginationItem']"), function (e) {
+    return (e.getAttribute('class') || '').indexOf('selected') !== -1 || e.getAttribute('aria-current') === 'page';
+});
+return !selected.length || selected.some(function (e) { return (e.textContent || '').trim() === page; });
+"""
+
+# Walks the DOM once and buckets elements for debug_page_structure. For each keyword in
+# arguments[0] and each of PAGE_DEBUG_FIELDS (in order) returns [matchCount, firstThree],
+# followed by the a/button elements whose own text is a page number from 1 to 5.
+# Element entries are [tag, text, class, id, href] as in ELEMENT_SCAN_JS.
+PAGE_STRUCTURE_JS = """
+var keywords = arguments[0];
+var buckets = keywords.map(function () { return [[0, []], [0, []], [0, []], [0, []]]; });
+var numeric = [];
+function describe(e) {
+    return [e.tagName.toLowerCase(), (e.textContent || '').trim().slice(0, 50),
+            e.getAttribute('class') || '', e.getAttribute('id') || '', e.href || e.getAttribute('href') || ''];
+}
+function ownText(e) {
+    for (var n = e.firstChild; n; n = n.nextSibling) {
+        if (n.nodeType === 3) return n.nodeValue;
+    }
+    return '';
+}
+var all = document.getElementsByTagName('*');
+for (var i = 0; i < all.length; i++) {
+    var e = all[i];
+    var fields = [e.getAttribute('class') || '', e.getAttribute('id') || '', ownText(e), e.getAttribute('data-testid') || ''];
+    for (var k = 0; k < keywords.length; k++) {
+        for (var f = 0; f < fields.length; f++) {
+            if (fields[f].indexOf(keywords[k]) === -1) continue;
+            var bucket = buckets[k][f];
+            bucket[0]++;
+            if (bucket[1].length < 3) bucket[1].push(describe(e));
+        }
+    }
+    if ((e.tagName === 'A' || e.tagName === 'BUTTON') && /^[1-5]$/.test(ownText(e))) numeric.push(describe(e));
+}
+return [buckets, numeric];
+"""
+
+# Attribute (or own text) names matching the per-keyword buckets of PAGE_STRUCTURE_JS
+PAGE_DEBUG_FIELDS = ('class', 'id', 'text', 'data-testid')
+
+
+class CardHTMLParser(HTMLParser):
+    """Collect text chunks, class attributes and buttons from a card's innerHTML.
+
+    Lets the per-card fallbacks run in-process on the snapshot instead of issuing
+    one find_elements() round-trip per XPath.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.texts: List[str] = []
+        self.classes: List[str] = []
+        self.buttons: List[Tuple[str, str]] = []  # (text, class)
+        self._button_depth = 0
+        self._button_class = ''
+        self._button_texts: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        class_attr = dict(attrs).get('class') or ''
+        if class_attr:
+            self.classes.append(class_attr)
+        if tag == 'button':
+            if not self._button_depth:
+                self._button_class = class_attr
+                self._button_texts = []
+            self._button_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag == 'button' and self._button_depth:
+            self._button_depth -= 1
+            if not self._button_depth:
+                self.buttons.append((' '.join(self._button_texts), self._button_class))
+
+    def handle_data(self, data):
+        text = data.strip()
+        if text:
+            self.texts.append(text)
+            if self._button_depth:
+                self._button_texts.append(text)
+
+
+class CardListHTMLParser(HTMLParser):
+    """Split a listing page's HTML into its tasker cards.
+
+    Each `div` whose `attr` equals `value` becomes a (text, innerHTML) pair, the text
+    being its non-blank text chunks one per line, like innerText. Lets the card
+    snapshot come from one page_source fetch when the batched script cannot run.
+    """
+
+    def __init__(self, attr: str, value: str):
+        super().__init__(convert_charrefs=True)
+        self.attr = attr
+        self.value = value
+        self.cards: List[Tuple[str, str]] = []
+        self._depth = 0  # open divs inside the current card, 0 outside cards
+        self._texts: List[str] = []
+        self._html: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if self._depth:
+            self._html.append(self.get_starttag_text())
+            if tag == 'div':
+                self._depth += 1
+        elif tag == 'div' and dict(attrs).get(self.attr) == self.value:
+            self._depth = 1
+            self._texts = []
+            self._html = []
+
+    def handle_endtag(self, tag):
+        if not self._depth:
+            return
+        if tag == 'div':
+            self._depth -= 1
+            if not self._depth:
+                self.cards.append(('\n'.join(self._texts), ''.join(self._html)))
+                return
+        self._html.append(f'</{tag}>')
+
+    def handle_data(self, data):
+        if self._depth:
+            self._html.append(data)
+            text = data.strip()
+            if text:
+                self._texts.append(text)
+
+
+class PaginationHTMLParser(HTMLParser):
+    """Collect MUI page-button labels and pagination links from a page's HTML.
+
+    Lets get_available_page_numbers read the page numbers from one page_source
+    fetch when the batched pagination scan cannot run.
+    """
+
+    CONTAINER_TAGS = ('nav', 'div', 'ul')
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.mui_texts: List[str] = []
+        self.links: List[Tuple[str, str]] = []  # (text, href) inside pagination containers
+        self._containers: List[bool] = []
+        self._container_depth = 0
+        self._capture = None  # 'mui' or 'a' while inside a page button or link
+        self._href = ''
+        self._texts: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        class_attr = attrs.get('class') or ''
+        if tag in self.CONTAINER_TAGS:
+            is_container = tag == 'nav' or 'pagination' in class_attr
+            self._containers.append(is_container)
+            self._container_depth += is_container
+        if self._capture:
+            return
+        if tag == 'button' and 'MuiPaginationItem' in class_attr:
+            self._capture, self._texts = 'mui', []
+        elif tag == 'a' and self._container_depth:
+            self._capture, self._href, self._texts = 'a', attrs.get('href') or '', []
+
+    def handle_endtag(self, tag):
+        if tag in self.CONTAINER_TAGS and self._containers:
+            self._container_depth -= self._containers.pop()
+        if self._capture == 'mui' and tag == 'button':
+            self.mui_texts.append(''.join(self._texts).strip())
+            self._capture = None
+        elif self._capture == 'a' and tag == 'a':
+            self.links.append((''.join(self._texts).strip(), self._href))
+            self._capture = None
+
+    def handle_data(self, data):
+        if self._capture:
+            self._texts.append(data)
+
+
+def page_numbers_from_html(page_html: str) -> Tuple[List[int], bool]:
+    """Page numbers found in `page_html`, and whether they came from MUI page buttons."""
+    parser = PaginationHTMLParser()
+    parser.feed(page_html)
+    mui = {int(text) for text in parser.mui_texts if text.isdigit()}
+    if mui:
+        return sorted(mui), True
+    found = set()
+    for text, href in parser.links:
+        page_match = _PAGE_RE.search(href)
+        if page_match:
+            found.add(int(page_match.group(1)))
+        elif text.isdigit():
+            found.add(int(text))
+    return sorted(found), False
+
+
+def cards_from_html(page_html: str) -> List[Tuple[str, str]]:
+    """(text, innerHTML) of every primary-selector tasker card in `page_html`, in page order."""
+    parser = CardListHTMLParser(*TASKER_CARD_ATTR)
+    parser.feed(page_html)
+    return parser.cards
+
+
+def find_price(pattern: re.Pattern, text: str):
+    """First match of a '$'-prefixed `pattern` in `text`, like pattern.search(text).
+
+    Jumps between '$' characters with str.find and only runs the regex anchored at
+    each one, so texts without a price are rejected without a regex scan.
+    """
+    i = text.find('$')
+    while i != -1:
+        match = pattern.match(text, i)
+        if match:
+            return match
+        i = text.find('$', i + 1)
+    return None
+
+
+def parse_card_html(card_html: str) -> CardHTMLParser:
+    """Parse a card's innerHTML snapshot into a CardHTMLParser."""
+    parser = CardHTMLParser()
+    try:
+        parser.feed(card_html)
+        parser.close()
+    except Exception:
+        pass
+    return parser
+
 
 def extract_tasker_data(ctx) -> List[Dict[str, str]]:
     """Extract tasker names and hourly rates from all paginated pages."""
     logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
-    logger.info("Extracting tasker data from all pages...")
     all_taskers: List[Dict[str, str]] = []
+    for _, page_taskers in iter_tasker_pages(ctx):
+        all_taskers.extend(page_taskers)
+    logger.info(f"Total taskers extracted from all pages: {len(all_taskers)}")
+    return all_taskers
+
+
+def iter_tasker_pages(ctx) -> Iterator[Tuple[int, List[Dict[str, str]]]]:
+    """Yield (page_num, taskers) for every listing page with taskers, in page order.
+
+    Each page is yielded as soon as it is scraped, so callers can persist results
+    incrementally instead of waiting for the whole crawl.
+    """
+    logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
+    logger.info("Extracting tasker data from all pages...")
 
     # First, get all available page numbers
     available_pages = get_available_page_numbers(ctx)
@@ -24,17 +507,41 @@ def extract_tasker_data(ctx) -> List[Dict[str, str]]:
 
     logger.info(f"Found {len(available_pages)} pages to process: {available_pages}")
 
-    # Process each page individually
+    cached = load_cached_pages(ctx, available_pages)
+    pages_to_scrape = [page_num for page_num in available_pages if page_num not in cached]
+    if cached:
+        logger.info(f"Loaded {len(cached)} pages from cache: {sorted(cached)}")
+
+    page_workers = ctx.__dict__.get('page_workers', 1)
+    if page_workers > 1 and len(pages_to_scrape) > 1 and ctx.__dict__.get('listing_url'):
+        scraped = iter_pages_in_parallel(ctx, pages_to_scrape, page_workers)
+    else:
+        scraped = iter_pages_serially(ctx, pages_to_scrape)
+
     for page_num in available_pages:
+        if page_num in cached:
+            page_taskers = cached[page_num]
+        else:
+            _, page_taskers = next(scraped)
+            store_cached_page(ctx, page_num, page_taskers)
+        if page_taskers:
+            yield page_num, page_taskers
+
+
+def iter_pages_serially(ctx, pages: List[int]) -> Iterator[Tuple[int, List[Dict[str, str]]]]:
+    """Scrape `pages` one after another on the main driver, yielding (page_num, taskers)
+    for every page (an empty list if it could not be scraped)."""
+    logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
+    for page_num in pages:
         logger.info(f"Processing page {page_num}...")
 
         # Navigate to the specific page if not page 1
         if page_num > 1:
-            success = navigate_to_page_number(ctx, page_num)
+            success = go_to_page(ctx, page_num)
             if not success:
                 logger.warning(f"Failed to navigate to page {page_num}, skipping...")
+                yield page_num, []
                 continue
-            time.sleep(ctx.__dict__.get('SLEEP_PAGE_NAVIGATION', 3))
 
         # Debug: capture all visible names before extraction
         debug_visible_names(ctx)
@@ -44,13 +551,255 @@ def extract_tasker_data(ctx) -> List[Dict[str, str]]:
 
         if not page_taskers:
             logger.warning(f"No taskers found on page {page_num}, but continuing to next page...")
-            continue
+        else:
+            logger.info(f"Found {len(page_taskers)} taskers on page {page_num}")
+        yield page_num, page_taskers
 
-        logger.info(f"Found {len(page_taskers)} taskers on page {page_num}")
-        all_taskers.extend(page_taskers)
 
-    logger.info(f"Total taskers extracted from all pages: {len(all_taskers)}")
-    return all_taskers
+def load_cached_pages(ctx, pages: List[int]) -> Dict[int, List[Dict[str, str]]]:
+    """Return the taskers of each page in `pages` with a fresh entry in the page cache.
+
+    The cache is a shelf opened by the parser, keyed by page URL, holding
+    (timestamp, taskers) tuples. Entries older than `page_cache_ttl` seconds are ignored.
+    """
+    cache = ctx.__dict__.get('page_cache')
+    listing_url = ctx.__dict__.get('listing_url')
+    if cache is None or not listing_url:
+        return {}
+    ttl = ctx.__dict__.get('page_cache_ttl', 3600)
+    now = time.time()
+    cached = {}
+    for page_num in pages:
+        entry = cache.get(build_page_url(listing_url, page_num))
+        if entry and now - entry[0] < ttl and entry[1]:
+            cached[page_num] = entry[1]
+    return cached
+
+
+def store_cached_page(ctx, page_num: int, taskers: List[Dict[str, str]]) -> None:
+    """Save a freshly scraped page in the page cache, if one is enabled."""
+    cache = ctx.__dict__.get('page_cache')
+    listing_url = ctx.__dict__.get('listing_url')
+    if cache is None or not listing_url or not taskers:
+        return
+    cache[build_page_url(listing_url, page_num)] = (time.time(), taskers)
+
+
+def go_to_page(ctx, page_num: int) -> bool:
+    """Navigate to `page_num` and wait until the previous page's cards are replaced.
+
+    Waits on the staleness of the first current card instead of a fixed
+    SLEEP_PAGE_NAVIGATION pause, which now only caps the wait.
+    """
+    logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
+    driver = ctx.driver
+    old_cards = driver.find_elements(By.CSS_SELECTOR, TASKER_CARD_CSS)
+    if not navigate_to_page_number(ctx, page_num):
+        return False
+    if old_cards:
+        try:
+            WebDriverWait(driver, ctx.__dict__.get('SLEEP_PAGE_NAVIGATION', 3)).until(EC.staleness_of(old_cards[0]))
+        except TimeoutException:
+            logger.debug(f"Cards from the previous page are still attached after navigating to page {page_num}")
+    return True
+
+
+class DriverContext:
+    """View of a parser context bound to another WebDriver, so page workers can reuse
+    the single-page extraction helpers with their own browser."""
+
+    def __init__(self, ctx, driver):
+        self._ctx = ctx
+        self.driver = driver
+
+    def __getattr__(self, name):
+        return getattr(self._ctx, name)
+
+
+def build_page_url(listing_url: str, page_num: int) -> str:
+    """Return `listing_url` with its `page` query parameter set to `page_num`."""
+    parts = urlparse(listing_url)
+    query = parse_qs(parts.query)
+    query['page'] = [str(page_num)]
+    return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
+
+
+def create_worker_driver(ctx, cookies: List[Dict], browsers: DriverPool):
+    """Borrow a warm browser from `browsers` and give it the main session's cookies."""
+    logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
+    driver = browsers.acquire()
+    try:
+        # Cookies can only be set for the current domain, so land on the site first
+        driver.get(ctx.base_url)
+    except Exception:
+        browsers.release(driver)
+        raise
+    for cookie in cookies:
+        try:
+            driver.add_cookie(cookie)
+        except Exception as e:
+            logger.debug(f"Could not copy cookie {cookie.get('name')}: {e}")
+    return driver
+
+
+def scrape_page(ctx, page_num: int, pool: DriverPool) -> List[Dict[str, str]]:
+    """Scrape one listing page with a warm browser borrowed from `pool`.
+
+    Returns [] when the browser does not end up on page `page_num` (e.g. the listing
+    ignores the page parameter), so the caller retries it through the pagination controls
+    instead of recording another page's cards under this number.
+    """
+    logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
+    with pool.driver() as driver:
+        driver.get(build_page_url(ctx.listing_url, page_num))
+        try:
+            WebDriverWait(driver, 8, poll_frequency=0.2).until(
+                lambda d: d.execute_script(URL_PAGE_READY_JS, page_num, TASKER_CARD_CSS)
+            )
+        except TimeoutException:
+            logger.debug(f"Worker browser did not reach page {page_num} by URL")
+            return []
+        return extract_taskers_from_current_page(DriverContext(ctx, driver))
+
+
+def iter_pages_in_parallel(ctx, available_pages: List[int], page_workers: int) -> Iterator[Tuple[int, List[Dict[str, str]]]]:
+    """Scrape listing pages concurrently, each worker driving its own browser.
+
+    Yields (page_num, taskers) for every page in `available_pages`, in page order.
+    Page 1 is extracted from the main driver (already on it); the other pages are opened
+    by URL in worker browsers borrowed from ctx.worker_browsers(), which stay warm across
+    pages and are handed back (not quit) once the crawl is done. Pages a worker could
+    not scrape are retried through the pagination controls on the main driver. Each
+    page is yielded as soon as it is available.
+    """
+    logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
+    cookies = ctx.driver.get_cookies()
+    other_pages = [page_num for page_num in available_pages if page_num != 1]
+
+    workers = min(page_workers, len(other_pages))
+    browsers = ctx.worker_browsers()
+    pool = DriverPool(lambda: create_worker_driver(ctx, cookies, browsers), size=workers,
+                      dispose=browsers.release)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {page_num: executor.submit(scrape_page, ctx, page_num, pool) for page_num in other_pages}
+            for page_num in available_pages:
+                if page_num == 1:
+                    page_taskers = extract_taskers_from_current_page(ctx)
+                else:
+                    try:
+                        page_taskers = futures[page_num].result()
+                    except Exception as e:
+                        logger.warning(f"Worker failed on page {page_num}: {e}")
+                        page_taskers = []
+                    # The main driver is idle once page 1 is done, so retry empty pages on it
+                    if not page_taskers:
+                        logger.info(f"Retrying page {page_num} sequentially...")
+                        if go_to_page(ctx, page_num):
+                            page_taskers = extract_taskers_from_current_page(ctx)
+                logger.info(f"Found {len(page_taskers)} taskers on page {page_num}")
+                yield page_num, page_taskers
+    finally:
+        pool.close()
+
+
+def snapshot_cards(ctx, cards) -> List[CardSnapshot]:
+    """Return (text, innerHTML, name_texts, rate_texts) for each card in a single execute_script call.
+
+    name_texts/rate_texts are lists of visible element texts, one list per selector in
+    NAME_SELECTORS_CARD/RATE_SELECTORS_CARD, so callers can keep selector priority.
+    """
+    logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
+    try:
+        snapshots = ctx.driver.execute_script(CARD_SNAPSHOT_JS, cards, NAME_SELECTORS_CARD, RATE_SELECTORS_CARD)
+        return [(text or '', html or '', names, rates) for text, html, names, rates in snapshots]
+    except Exception as e:
+        logger.debug(f"Batched card snapshot failed, reading cards one by one: {e}")
+        snapshots = []
+        for card in cards:
+            # One stale card fails the whole batch, so first try the same script on this card alone
+            try:
+                (text, html, names, rates), = ctx.driver.execute_script(
+                    CARD_SNAPSHOT_JS, [card], NAME_SELECTORS_CARD, RATE_SELECTORS_CARD
+                )
+                snapshots.append((text or '', html or '', names, rates))
+                continue
+            except Exception:
+                pass
+            seen: Dict[str, Optional[str]] = {}  # element id -> text, None when hidden; shared by both lists
+            snapshots.append((
+                card.text or '',
+                card.get_attribute('innerHTML') or '',
+                _visible_texts(card, NAME_SELECTORS_CARD, seen),
+                _visible_texts(card, RATE_SELECTORS_CARD, seen),
+            ))
+        return snapshots
+
+
+def _visible_texts(card, locators, seen: Dict[str, Optional[str]]) -> Iterator[List[str]]:
+    """Per-locator texts of the displayed elements inside `card` (slow per-element path).
+
+    Lazy: a locator is only queried when the caller reaches it, so once the extraction
+    loop finds a valid name or rate the remaining locators never hit the browser. An
+    element matched by several locators is checked and read once, via `seen`.
+    """
+    for locator in locators:
+        texts: List[str] = []
+        try:
+            for element in card.find_elements(*locator):
+                if element.id not in seen:
+                    seen[element.id] = element.text if element.is_displayed() else None
+                if seen[element.id] is not None:
+                    texts.append(seen[element.id])
+        except Exception:
+            pass
+        yield texts
+
+
+def snapshot_page_cards(ctx, limit: int) -> List[CardSnapshot]:
+    """Find the tasker cards (primary selector, then fallbacks) and snapshot the first `limit`.
+
+    Lookup and snapshots take one execute_script call. If it fails, the page HTML is
+    fetched once and split into primary-selector cards in-process (their name/rate
+    candidate lists stay empty, so the text and HTML fallbacks pick those up); only when
+    that finds no card are cards looked up with find_elements and read through
+    snapshot_cards().
+    """
+    logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
+    selectors = [TASKER_CARD_CSS] + list(TASKER_CARD_FALLBACK_CSS)
+    try:
+        index, count, snapshots = ctx.driver.execute_script(
+            PAGE_CARDS_SNAPSHOT_JS, selectors, limit, NAME_SELECTORS_CARD, RATE_SELECTORS_CARD
+        )
+        snapshots = [(text or '', html or '', names, rates) for text, html, names, rates in snapshots]
+    except Exception as e:
+        logger.debug(f"Batched card lookup failed, parsing the page HTML instead: {e}")
+        try:
+            cards = cards_from_html(ctx.driver.page_source)
+        except Exception as e2:
+            logger.debug(f"Could not parse cards from the page HTML: {e2}")
+            cards = []
+        index, count = 0, len(cards)
+        no_candidates = ([[] for _ in NAME_SELECTORS_CARD], [[] for _ in RATE_SELECTORS_CARD])
+        snapshots = [(text, html) + no_candidates for text, html in cards[:limit]]
+        if not cards:
+            logger.debug("No cards in the page HTML, finding cards one selector at a time")
+            cards = []
+            for index, selector in enumerate(selectors):
+                cards = ctx.driver.find_elements(By.CSS_SELECTOR, selector)
+                if cards:
+                    count = len(cards)
+                    break
+            snapshots = snapshot_cards(ctx, cards[:limit]) if cards else []
+
+    if count:
+        if index == 0:
+            logger.info(f"Found {count} tasker cards with primary selector")
+        else:
+            logger.info(f"Found {count} tasker cards with fallback selector: {selectors[index]}")
+        if count > limit:
+            logger.info(f"Found {count} cards, limiting to {limit} per page as specified")
+    return snapshots
 
 
 def extract_taskers_from_current_page(ctx) -> List[Dict[str, str]]:
@@ -61,80 +810,55 @@ def extract_taskers_from_current_page(ctx) -> List[Dict[str, str]]:
     logger.debug("Extracting taskers from current page...")
     taskers: List[Dict[str, str]] = []
 
-    # Enhanced debug logging to capture what we actually see
-    logger.info(f"Current URL: {driver.current_url}")
-    logger.info(f"Page title: {driver.title}")
-
-    # Wait for tasker cards to load
-    time.sleep(ctx.__dict__.get('SLEEP_CARD_LOADING', 5))
+    # Enhanced debug logging to capture what we actually see (two round-trips, so only when shown)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Current URL: {driver.current_url}")
+        logger.info(f"Page title: {driver.title}")
 
-    # Find tasker cards using the mobile card selector from HTML analysis
-    tasker_card_selector = "//div[@data-testid='tasker-card-mobile']"
-    tasker_cards = driver.find_elements(By.XPATH, tasker_card_selector)
-
-    if not tasker_cards:
-        # Fallback to other selectors
-        fallback_selectors = [
-            "//div[contains(@class, 'mui-1m4n54b')]",
-            "//div[contains(@data-testid, 'tasker')]",
-            "//div[contains(@class, 'tasker')]",
-            "//div[contains(@class, 'card')]",
-        ]
-        for selector in fallback_selectors:
-            tasker_cards = driver.find_elements(By.XPATH, selector)
-            if tasker_cards:
-                logger.info(f"Found {len(tasker_cards)} tasker cards with fallback selector: {selector}")
-                break
-    else:
-        logger.info(f"Found {len(tasker_cards)} tasker cards with primary selector")
+    # Wait for tasker cards to load (returns as soon as the first card is present)
+    try:
+        WebDriverWait(driver, ctx.__dict__.get('SLEEP_CARD_LOADING', 5) * 2).until(CARDS_PRESENT)
+    except TimeoutException:
+        logger.debug("Primary tasker card selector did not appear, trying fallbacks")
 
-    if not tasker_cards:
+    # Find the cards and fetch every card's text, HTML and name/rate candidates in one
+    # round-trip; all parsing below runs in-process
+    snapshots = snapshot_page_cards(ctx, MAX_CARDS_PER_PAGE)
+    if not snapshots:
         logger.error("No tasker cards found on page")
         return []
-
-    # Limit to 15 taskers per page as specified
-    if len(tasker_cards) > 15:
-        logger.info(f"Found {len(tasker_cards)} cards, limiting to 15 per page as specified")
-        tasker_cards = tasker_cards[:15]
-    logger.info(f"Processing {len(tasker_cards)} tasker cards")
+    logger.info(f"Processing {len(snapshots)} tasker cards")
 
     # Extract name and rate from each card
-    for i, card in enumerate(tasker_cards):
+    for i, (card_text, card_html, name_texts, rate_texts) in enumerate(snapshots):
         try:
-            # Extract name
+            card_doc = parse_card_html(card_html)
+
+            # Extract name (candidate texts were collected in-browser, in selector priority order)
             name = "Name not found"
-            for selector in NAME_SELECTORS_CARD:
-                try:
-                    name_elements = card.find_elements(By.XPATH, selector)
-                    for name_element in name_elements:
-                        if name_element and name_element.is_displayed():
-                            name_text = name_element.text.strip()
-                            if ctx.is_potential_name(name_text):
-                                name = name_text
-                                break
-                    if name != "Name not found":
+            for selector_texts in name_texts:
+                for name_text in selector_texts:
+                    name_text = name_text.strip()
+                    if ctx.is_potential_name(name_text):
+                        name = name_text
                         break
-                except Exception:
-                    continue
+                if name != "Name not found":
+                    break
 
             # Aggressive extraction fallback
             if name == "Name not found":
                 try:
-                    card_text = card.text
-                    name_patterns = re.findall(r"\b[A-Z][a-z]+ [A-Z]\.|\b[A-Z][A-Z]+ [A-Z]\.", card_text)
+                    name_patterns = _CARD_TEXT_NAME_RE.findall(card_text)
                     if name_patterns:
                         name = name_patterns[0]
                     else:
-                        all_text_elements = card.find_elements(By.XPATH, ".//*[text()]")
-                        for elem in all_text_elements:
-                            elem_text = elem.text.strip()
+                        for elem_text in card_doc.texts:
                             if ctx.is_potential_name(elem_text):
                                 name = elem_text
                                 break
                         if name == "Name not found":
-                            card_html = card.get_attribute('innerHTML')
                             if card_html:
-                                html_name_patterns = re.findall(r">([A-Za-z][a-z]+(?:\s+[A-Za-z][a-z]+)*\s+[A-Z]\.)<|>([A-Z][A-Z]+(?:\s+[A-Z][A-Z]+)*\s+[A-Z]\.)<", card_html)
+                                html_name_patterns = _CARD_HTML_NAME_RE.findall(card_html)
                                 for pattern_match in html_name_patterns:
                                     potential_name = pattern_match[0] or pattern_match[1]
                                     if potential_name and ctx.is_potential_name(potential_name):
@@ -145,17 +869,11 @@ def extract_taskers_from_current_page(ctx) -> List[Dict[str, str]]:
 
             if name == "Name not found":
                 try:
-                    card_text = card.text.strip()
-                    logger.warning(f"Could not find valid name in card {i+1}. Card text preview: '{card_text[:200]}...'")
-                    all_buttons = card.find_elements(By.XPATH, ".//button")
-                    logger.debug(f"Card {i+1} has {len(all_buttons)} buttons:")
-                    for btn_idx, btn in enumerate(all_buttons[:5]):
-                        try:
-                            btn_text = btn.text.strip()
-                            if btn_text:
-                                logger.debug(f"  Button {btn_idx+1}: '{btn_text}' (classes: {btn.get_attribute('class')})")
-                        except Exception:
-                            pass
+                    logger.warning(f"Could not find valid name in card {i+1}. Card text preview: '{card_text.strip()[:200]}...'")
+                    logger.debug(f"Card {i+1} has {len(card_doc.buttons)} buttons:")
+                    for btn_idx, (btn_text, btn_class) in enumerate(card_doc.buttons[:5]):
+                        if btn_text:
+                            logger.debug(f"  Button {btn_idx+1}: '{btn_text}' (classes: {btn_class})")
                 except Exception as e:
                     logger.debug(f"Error debugging card {i+1}: {e}")
                 continue
@@ -167,69 +885,49 @@ def extract_taskers_from_current_page(ctx) -> List[Dict[str, str]]:
 
             # Extract rate
             rate = "Rate not found"
-            for selector in RATE_SELECTORS_CARD:
-                try:
-                    rate_elements = card.find_elements(By.XPATH, selector)
-                    for rate_element in rate_elements:
-                        if rate_element and rate_element.is_displayed():
-                            rate_text = rate_element.text.strip()
-                            if '$' in rate_text and '/hr' in rate_text and len(rate_text) < 20:
-                                if re.search(r"\$\d+(?:\.\d+)?/hr", rate_text):
-                                    rate = rate_text
-                                    break
-                    if rate != "Rate not found":
-                        break
-                except Exception:
-                    continue
+            for selector_texts in rate_texts:
+                for rate_text in selector_texts:
+                    rate_text = rate_text.strip()
+                    if '$' in rate_text and '/hr' in rate_text and len(rate_text) < 20:
+                        if find_price(_HOURLY_RATE_RE, rate_text):
+                            rate = rate_text
+                            break
+                if rate != "Rate not found":
+                    break
 
             if rate == "Rate not found":
-                try:
-                    card_text = card.text
-                    rate_matches = re.findall(r"\$\d+(?:\.\d+)?/hr", card_text)
-                    if rate_matches:
-                        rate = rate_matches[0]
-                    else:
-                        card_html = card.get_attribute('innerHTML')
-                        if card_html:
-                            html_rate_matches = re.findall(r"\$\d+(?:\.\d+)?/hr", card_html)
-                            if html_rate_matches:
-                                rate = html_rate_matches[0]
-                            else:
-                                price_matches = re.findall(r"\$(\d+\.\d+)", card_html)
-                                if price_matches:
-                                    rate = f"${price_matches[0]}/hr"
-                except Exception:
-                    pass
+                # Hourly rate in the card text, then in the HTML, then any decimal price in the HTML
+                rate_match = find_price(_HOURLY_RATE_RE, card_text) or find_price(_HOURLY_RATE_RE, card_html)
+                if rate_match:
+                    rate = rate_match.group(0)
+                else:
+                    price_match = find_price(_DECIMAL_PRICE_RE, card_html)
+                    if price_match:
+                        rate = f"${price_match.group(1)}/hr"
 
             # Extract reviews
             review_rating = "Not found"
             review_count = "Not found"
             try:
-                review_selectors = [
-                    ".//*[contains(text(), '(') and contains(text(), 'review')]",
-                    ".//*[contains(text(), '★') or contains(text(), '⭐')]",
+                # Text chunks that look like a review summary first, then the whole card
+                review_texts = [
+                    text for text in card_doc.texts
+                    if ('(' in text and 'review' in text) or '★' in text or '⭐' in text
                 ]
-                for selector in review_selectors:
-                    review_elements = card.find_elements(By.XPATH, selector)
-                    for elem in review_elements:
-                        text = elem.text.strip()
-                        match = re.search(r"(\d+\.\d+)\s*\((\d+)\s*review", text)
-                        if match:
-                            review_rating = match.group(1)
-                            review_count = match.group(2)
-                            break
-                    if review_rating != "Not found":
+                for text in review_texts:
+                    match = _REVIEW_RE.search(text)
+                    if match:
+                        review_rating = match.group(1)
+                        review_count = match.group(2)
                         break
                 if review_rating == "Not found":
-                    card_text = card.text
-                    match = re.search(r"(\d+\.\d+)\s*\((\d+)\s*review", card_text)
+                    match = _REVIEW_RE.search(card_text)
                     if match:
                         review_rating = match.group(1)
                         review_count = match.group(2)
                     else:
-                        card_html = card.get_attribute('innerHTML')
                         if card_html:
-                            html_match = re.search(r"(\d+\.\d+)\s*\((\d+)\s*review", card_html)
+                            html_match = _REVIEW_RE.search(card_html)
                             if html_match:
                                 review_rating = html_match.group(1)
                                 review_count = html_match.group(2)
@@ -240,32 +938,23 @@ def extract_taskers_from_current_page(ctx) -> List[Dict[str, str]]:
             furniture_tasks = "Not found"
             overall_tasks = "Not found"
             try:
-                card_text = card.text
-                furniture_match = re.search(r"(\d+)\s+Furniture Assembly tasks", card_text)
+                furniture_match = _FURNITURE_TASKS_RE.search(card_text)
                 if furniture_match:
                     furniture_tasks = furniture_match.group(1)
-                overall_patterns = [
-                    r"(\d+)\s+Assembly tasks overall",
-                    r"(\d+)\s+tasks overall",
-                    r"(\d+)\s+overall tasks",
-                    r"(\d+)\s+total tasks",
-                    r"(\d+)\s+tasks completed",
-                ]
-                for pattern in overall_patterns:
-                    overall_match = re.search(pattern, card_text, re.IGNORECASE)
+                for pattern in _OVERALL_TASKS_RES:
+                    overall_match = pattern.search(card_text)
                     if overall_match:
                         overall_tasks = overall_match.group(1)
                         break
                 if furniture_tasks == "Not found" or overall_tasks == "Not found":
-                    card_html = card.get_attribute('innerHTML')
                     if card_html:
                         if furniture_tasks == "Not found":
-                            html_furniture_match = re.search(r"(\d+)\s+Furniture Assembly tasks", card_html)
+                            html_furniture_match = _FURNITURE_TASKS_RE.search(card_html)
                             if html_furniture_match:
                                 furniture_tasks = html_furniture_match.group(1)
                         if overall_tasks == "Not found":
-                            for pattern in overall_patterns:
-                                html_overall_match = re.search(pattern, card_html, re.IGNORECASE)
+                            for pattern in _OVERALL_TASKS_RES:
+                                html_overall_match = pattern.search(card_html)
                                 if html_overall_match:
                                     overall_tasks = html_overall_match.group(1)
                                     break
@@ -277,73 +966,23 @@ def extract_taskers_from_current_page(ctx) -> List[Dict[str, str]]:
             # Flags
             two_hour_minimum = False
             try:
-                card_text = card.text
-                card_html = card.get_attribute('innerHTML') or ''
-                minimum_patterns = [
-                    r"2\s*Hour\s*Minimum",
-                    r"2\s*hr\s*minimum",
-                    r"2\s*hour\s*min",
-                    r"minimum\s*2\s*hour",
-                    r"min\s*2\s*hr",
-                ]
-                for pattern in minimum_patterns:
-                    if re.search(pattern, card_text, re.IGNORECASE):
-                        two_hour_minimum = True
-                        break
+                two_hour_minimum = bool(_TWO_HOUR_MINIMUM_RE.search(card_text) or _TWO_HOUR_MINIMUM_RE.search(card_html))
                 if not two_hour_minimum:
-                    for pattern in minimum_patterns:
-                        if re.search(pattern, card_html, re.IGNORECASE):
-                            two_hour_minimum = True
-                            break
-                if not two_hour_minimum:
-                    minimum_selectors = [
-                        ".//*[contains(text(), '2 Hour Minimum')]",
-                        ".//*[contains(text(), '2 hour minimum')]",
-                        ".//*[contains(text(), '2hr minimum')]",
-                        ".//*[contains(text(), 'Minimum 2 hour')]",
-                        ".//*[contains(text(), 'minimum 2 hr')]",
-                    ]
-                    for selector in minimum_selectors:
-                        try:
-                            elements = card.find_elements(By.XPATH, selector)
-                            if elements and any(elem.is_displayed() for elem in elements):
-                                two_hour_minimum = True
-                                break
-                        except Exception:
-                            continue
+                    minimum_phrases = ('2 Hour Minimum', '2 hour minimum', '2hr minimum', 'Minimum 2 hour', 'minimum 2 hr')
+                    two_hour_minimum = any(
+                        phrase in text for text in card_doc.texts for phrase in minimum_phrases
+                    )
             except Exception as e:
                 logger.debug(f"Error extracting 2 Hour Minimum flag: {e}")
 
             elite_status = False
             try:
-                card_text = card.text
-                card_html = card.get_attribute('innerHTML') or ''
-                elite_patterns = [r"\bElite\b", r"\bELITE\b", r"\belite\b"]
-                for pattern in elite_patterns:
-                    if re.search(pattern, card_text):
-                        elite_status = True
-                        break
+                elite_status = bool(_ELITE_RE.search(card_text) or _ELITE_RE.search(card_html))
                 if not elite_status:
-                    for pattern in elite_patterns:
-                        if re.search(pattern, card_html):
-                            elite_status = True
-                            break
-                if not elite_status:
-                    elite_selectors = [
-                        ".//*[contains(text(), 'Elite')]",
-                        ".//*[contains(text(), 'ELITE')]",
-                        ".//*[contains(text(), 'elite')]",
-                        ".//*[contains(@class, 'elite')]",
-                        ".//*[contains(@class, 'Elite')]",
-                    ]
-                    for selector in elite_selectors:
-                        try:
-                            elements = card.find_elements(By.XPATH, selector)
-                            if elements and any(elem.is_displayed() for elem in elements):
-                                elite_status = True
-                                break
-                        except Exception:
-                            continue
+                    elite_status = (
+                        any(marker in text for text in card_doc.texts for marker in ('Elite', 'ELITE', 'elite'))
+                        or any('elite' in class_attr or 'Elite' in class_attr for class_attr in card_doc.classes)
+                    )
             except Exception as e:
                 logger.debug(f"Error extracting Elite status: {e}")
 
@@ -368,16 +1007,14 @@ def extract_taskers_from_current_page(ctx) -> List[Dict[str, str]]:
                 f"Tasks: {furniture_tasks} furniture, {overall_tasks} overall - 2Hr Min: {two_hour_minimum} - Elite: {elite_status}"
             )
 
-            if rate == "Rate not found":
-                logger.debug(f"Card {i+1} text sample: {card.text[:200]}...")
-                try:
-                    dollar_elements = card.find_elements(By.XPATH, ".//*[contains(text(), '$')]")
-                    if dollar_elements:
-                        logger.debug(f"Found {len(dollar_elements)} elements with $ in card {i+1}")
-                        for elem in dollar_elements[:3]:
-                            logger.debug(f"  $ element: '{elem.text.strip()}'")
-                except Exception:
-                    pass
+            if rate == "Rate not found" and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Card {i+1} text sample: {card_text[:200]}...")
+                # Taken from the card HTML already parsed above, so no extra browser call
+                dollar_texts = [text for text in card_doc.texts if '$' in text]
+                if dollar_texts:
+                    logger.debug(f"Found {len(dollar_texts)} elements with $ in card {i+1}")
+                    for text in dollar_texts[:3]:
+                        logger.debug(f"  $ element: '{text.strip()}'")
 
         except Exception as e:
             logger.warning(f"Error processing tasker card {i+1}: {e}")
@@ -396,27 +1033,86 @@ def extract_taskers_from_current_page(ctx) -> List[Dict[str, str]]:
     return taskers
 
 
+def scan_elements(ctx, locators: List[Tuple[str, str]], limit: int = 0, fallback: bool = True,
+                  visible_only: bool = False) -> List[Tuple[int, List[ElementInfo]]]:
+    """Evaluate every (By, value) locator in `locators` in one execute_script call.
+
+    Returns (match_count, elements) per locator, in order; see ElementInfo for the
+    element fields. `limit` caps how many elements are described per locator, and
+    `visible_only` leaves hidden ones out in the browser (match_count still counts
+    them). If the script fails, the locators are queried one by one, or the error is
+    raised when `fallback` is False.
+    """
+    logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
+    try:
+        scans = ctx.driver.execute_script(ELEMENT_SCAN_JS, locators, limit, visible_only)
+        return [(count, [tuple(info) for info in elements]) for count, elements in scans]
+    except Exception as e:
+        if not fallback:
+            raise
+        logger.debug(f"Batched element scan failed, querying locators one by one: {e}")
+        return [_scan_locator(ctx.driver, locator, limit, visible_only) for locator in locators]
+
+
+def _scan_locator(driver, locator: Tuple[str, str], limit: int,
+                  visible_only: bool = False) -> Tuple[int, List[ElementInfo]]:
+    """Fallback for one ELEMENT_SCAN_JS entry: a native lookup plus one property read."""
+    try:
+        elements = driver.find_elements(*locator)
+    except Exception:
+        return 0, []
+    if not visible_only:
+        return len(elements), element_props(driver, elements[:limit] if limit else elements)
+    infos = [info for info in element_props(driver, elements) if info[5]]
+    return len(elements), infos[:limit] if limit else infos
+
+
+def element_props(driver, elements) -> List[ElementInfo]:
+    """ElementInfo for each of `elements`, read in one execute_script call.
+
+    Falls back to per-element WebDriver calls (about six each) if the script fails.
+    """
+    try:
+        return [tuple(info) for info in driver.execute_script(ELEMENT_PROPS_JS, elements)]
+    except Exception:
+        pass
+    infos: List[ElementInfo] = []
+    for element in elements:
+        try:
+            displayed = element.is_displayed()
+            infos.append((
+                element.tag_name,
+                element.text.strip() if displayed else '',
+                element.get_attribute('class') or '',
+                element.get_attribute('id') or '',
+                element.get_attribute('href') or '',
+                displayed,
+                element.is_enabled(),
+            ))
+        except Exception:
+            continue
+    return infos
+
+
 def debug_visible_names(ctx):
     logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
-    driver = ctx.driver
+    # The page-wide scan below only feeds INFO logs; skip it when nobody will see them
+    if not logger.isEnabledFor(logging.INFO):
+        return []
     logger.info("=== DEBUGGING VISIBLE NAMES ON PAGE ===")
     try:
-        text_elements = driver.find_elements(By.XPATH, "//*[text()]")
-        potential_names = []
-        for element in text_elements:
-            try:
-                if element.is_displayed():
-                    text = element.text.strip()
-                    if (
-                        text and len(text) < 50 and any(c.isalpha() for c in text)
-                        and (' ' in text or '.' in text)
-                        and not any(keyword in text.lower() for keyword in ['http', 'www', 'email', 'phone', 'address'])
-                    ):
-                        potential_names.append(text)
-            except Exception:
-                continue
-        unique_names = list(set(potential_names))
-        unique_names.sort()
+        # Texts of every visible text-bearing element in one round-trip instead of .text per element
+        (_, text_elements), = scan_elements(ctx, [(By.XPATH, "//*[text()]")], visible_only=True)
+        # Deduplicate before filtering so each distinct text is checked once
+        visible_texts = {text for _, text, _, _, _, _, _ in text_elements if text}
+        unique_names = sorted(
+            text for text in visible_texts
+            if (
+                len(text) < 50 and any(c.isalpha() for c in text)
+                and (' ' in text or '.' in text)
+                and not any(keyword in text.lower() for keyword in ['http', 'www', 'email', 'phone', 'address'])
+            )
+        )
         logger.info(f"Found {len(unique_names)} potential names on page:")
         for i, name in enumerate(unique_names[:50]):
             logger.info(f"  {i+1}. '{name}'")
@@ -428,52 +1124,23 @@ def debug_visible_names(ctx):
 
 def debug_page_structure(ctx):
     logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
-    driver = ctx.driver
+    if not logger.isEnabledFor(logging.INFO):
+        return
     try:
         logger.info("=== DEBUGGING PAGE STRUCTURE FOR PAGINATION ===")
         pagination_keywords = ['page', 'next', 'prev', 'pagination', 'pager']
-        for keyword in pagination_keywords:
-            selectors = [
-                f"//*[contains(@class, '{keyword}')]",
-                f"//*[contains(@id, '{keyword}')]",
-                f"//*[contains(text(), '{keyword}')]",
-                f"//*[contains(@data-testid, '{keyword}')]",
-            ]
-            for selector in selectors:
-                try:
-                    elements = driver.find_elements(By.XPATH, selector)
-                    if elements:
-                        logger.info(f"Found {len(elements)} elements with '{keyword}' using selector: {selector}")
-                        for i, element in enumerate(elements[:3]):
-                            try:
-                                tag = element.tag_name
-                                text = element.text.strip()[:50]
-                                class_attr = element.get_attribute('class') or ''
-                                id_attr = element.get_attribute('id') or ''
-                                href = element.get_attribute('href') or ''
-                                logger.info(f"  Element {i+1}: <{tag}> text='{text}' class='{class_attr}' id='{id_attr}' href='{href}'")
-                            except Exception:
-                                continue
-                except Exception:
-                    continue
-        numeric_selectors = [
-            "//a[text()='1']", "//a[text()='2']", "//a[text()='3']", "//a[text()='4']", "//a[text()='5']",
-            "//button[text()='1']", "//button[text()='2']", "//button[text()='3']", "//button[text()='4']", "//button[text()='5']",
-        ]
-        for selector in numeric_selectors:
-            try:
-                elements = driver.find_elements(By.XPATH, selector)
-                if elements:
-                    logger.info(f"Found numeric elements with selector: {selector}")
-                    for element in elements:
-                        try:
-                            href = element.get_attribute('href') or ''
-                            class_attr = element.get_attribute('class') or ''
-                            logger.info(f"  Numeric element: href='{href}' class='{class_attr}'")
-                        except Exception:
-                            continue
-            except Exception:
-                continue
+        # A single DOM walk buckets every element by keyword and field instead of one query per pair
+        buckets, numeric = ctx.driver.execute_script(PAGE_STRUCTURE_JS, pagination_keywords)
+        for keyword, keyword_buckets in zip(pagination_keywords, buckets):
+            for field, (count, elements) in zip(PAGE_DEBUG_FIELDS, keyword_buckets):
+                if count:
+                    logger.info(f"Found {count} elements with '{keyword}' in {field}")
+                    for i, (tag, text, class_attr, id_attr, href) in enumerate(elements):
+                        logger.info(f"  Element {i+1}: <{tag}> text='{text}' class='{class_attr}' id='{id_attr}' href='{href}'")
+        if numeric:
+            logger.info(f"Found {len(numeric)} numeric pagination elements")
+            for tag, text, class_attr, _, href in numeric:
+                logger.info(f"  Numeric element: <{tag}> text='{text}' href='{href}' class='{class_attr}'")
         logger.info("=== END PAGE STRUCTURE DEBUG ===")
     except Exception as e:
         logger.error(f"Error in debug_page_structure: {e}")
@@ -481,51 +1148,40 @@ def debug_page_structure(ctx):
 
 def get_available_page_numbers(ctx) -> List[int]:
     logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
-    driver = ctx.driver
     try:
-        page_numbers: List[int] = []
+        found = set()
         debug_page_structure(ctx)
         logger.debug("Searching for pagination elements...")
-        pagination_selectors = [
-            "//nav//a[contains(@href, 'page=')]",
-            "//div[contains(@class, 'pagination')]//a[contains(@href, 'page=')]",
-            "//ul[contains(@class, 'pagination')]//a[contains(@href, 'page=')]",
-            "//div[contains(@class, 'page')]//a[contains(@href, 'page=')]",
-            "//nav//button[contains(@aria-label, 'Page')]",
-            "//div[contains(@class, 'pagination')]//button[contains(@aria-label, 'Page')]",
-            "//a[contains(@href, 'page=')]",
-            "//button[contains(@aria-label, 'Page')]",
-            "//div[contains(@class, 'page')]//a",
-            "//nav//a",
-            "//div[contains(@class, 'pagination')]//a",
-            "//ul[contains(@class, 'pagination')]//a",
-            "//span[contains(@class, 'page')]//a",
-            "//div[contains(@data-testid, 'page')]//a",
-            "//div[contains(@data-testid, 'pagination')]//a",
-        ]
-        mui_pagination_selectors = [
-            "//button[contains(@class, 'MuiPaginationItem-page')]",
-            "//button[contains(@class, 'MuiPaginationItem-root')]",
-        ]
-        for selector in mui_pagination_selectors:
-            try:
-                elements = driver.find_elements(By.XPATH, selector)
-                if elements:
-                    logger.debug(f"Found {len(elements)} MUI pagination elements with selector: {selector}")
-                for element in elements:
-                    if element.is_displayed():
-                        text = element.text.strip()
-                        class_attr = element.get_attribute('class') or ''
-                        logger.debug(f"MUI Pagination element: text='{text}', class='{class_attr}'")
-                        if text.isdigit():
-                            page_num = int(text)
-                            if page_num not in page_numbers:
-                                page_numbers.append(page_num)
-            except Exception as e:
-                logger.debug(f"Error processing MUI pagination element: {e}")
-                continue
-        if page_numbers:
-            page_numbers.sort()
+        # Evaluate every locator group in a single round-trip, then walk the groups in priority order
+        try:
+            scans = scan_elements(ctx, MUI_PAGINATION_SELECTORS + PAGINATION_SELECTORS + PAGINATION_TEXT_SELECTORS,
+                                  fallback=False, visible_only=True)
+        except Exception as e:
+            # One page_source fetch parsed in-process beats querying every element individually
+            logger.debug(f"Batched pagination scan failed, parsing page source instead: {e}")
+            page_numbers, from_mui = page_numbers_from_html(ctx.driver.page_source)
+            if page_numbers:
+                ctx._max_page = page_numbers[-1]
+                logger.info(f"Found page numbers in page source: {page_numbers}")
+                if from_mui and page_numbers[-1] > len(page_numbers):
+                    page_numbers = list(range(1, page_numbers[-1] + 1))
+                if ctx.max_pages and len(page_numbers) > ctx.max_pages:
+                    page_numbers = page_numbers[:ctx.max_pages]
+                    logger.info(f"Limited to first {ctx.max_pages} pages: {page_numbers}")
+            return page_numbers
+        mui_scans = scans[:len(MUI_PAGINATION_SELECTORS)]
+        pagination_scans = scans[len(MUI_PAGINATION_SELECTORS):len(MUI_PAGINATION_SELECTORS) + len(PAGINATION_SELECTORS)]
+        text_scans = scans[len(MUI_PAGINATION_SELECTORS) + len(PAGINATION_SELECTORS):]
+        for (_, selector), (count, elements) in zip(MUI_PAGINATION_SELECTORS, mui_scans):
+            if count:
+                logger.debug(f"Found {count} MUI pagination elements with selector: {selector}")
+            for _, text, class_attr, _, _, _, _ in elements:
+                logger.debug(f"MUI Pagination element: text='{text}', class='{class_attr}'")
+                if text.isdigit():
+                    found.add(int(text))
+        if found:
+            page_numbers = sorted(found)
+            ctx._max_page = page_numbers[-1]
             logger.info(f"Found visible MUI page numbers: {page_numbers}")
             if len(page_numbers) >= 2:
                 max_page = max(page_numbers)
@@ -542,57 +1198,35 @@ def get_available_page_numbers(ctx) -> List[int]:
                 page_numbers = page_numbers[:ctx.max_pages]
                 logger.info(f"Limited to first {ctx.max_pages} pages: {page_numbers}")
             return page_numbers
-        for selector in pagination_selectors:
-            try:
-                elements = driver.find_elements(By.XPATH, selector)
-                if elements:
-                    logger.debug(f"Found {len(elements)} elements with selector: {selector}")
-                for element in elements:
-                    if element.is_displayed():
-                        href = element.get_attribute('href') or ''
-                        text = element.text.strip()
-                        tag_name = element.tag_name
-                        class_attr = element.get_attribute('class') or ''
-                        logger.debug(f"Pagination element: tag={tag_name}, text='{text}', href='{href}', class='{class_attr}'")
-                        if 'page=' in href:
-                            page_match = re.search(r"page=(\d+)", href)
-                            if page_match:
-                                page_num = int(page_match.group(1))
-                                if page_num not in page_numbers:
-                                    page_numbers.append(page_num)
-                        elif text.isdigit():
-                            page_num = int(text)
-                            if page_num not in page_numbers:
-                                page_numbers.append(page_num)
-            except Exception as e:
-                logger.debug(f"Error processing pagination element: {e}")
-                continue
-        if page_numbers:
-            page_numbers.sort()
+        for (_, selector), (count, elements) in zip(PAGINATION_SELECTORS, pagination_scans):
+            if count:
+                logger.debug(f"Found {count} elements with selector: {selector}")
+            for tag_name, text, class_attr, _, href, _, _ in elements:
+                logger.debug(f"Pagination element: tag={tag_name}, text='{text}', href='{href}', class='{class_attr}'")
+                if 'page=' in href:
+                    page_match = _PAGE_RE.search(href)
+                    if page_match:
+                        found.add(int(page_match.group(1)))
+                elif text.isdigit():
+                    found.add(int(text))
+            # A dense 1..N range means this group rendered the whole pager; later groups only repeat it
+            if len(found) > 1 and max(found) - min(found) + 1 == len(found):
+                break
+        if found:
+            page_numbers = sorted(found)
+            ctx._max_page = page_numbers[-1]
             logger.info(f"Found page numbers: {page_numbers}")
             if ctx.max_pages and len(page_numbers) > ctx.max_pages:
                 page_numbers = page_numbers[:ctx.max_pages]
                 logger.info(f"Limited to first {ctx.max_pages} pages: {page_numbers}")
             return page_numbers
-        text_selectors = [
-            "//nav//a[text()]",
-            "//div[contains(@class, 'pagination')]//a[text()]",
-            "//ul[contains(@class, 'pagination')]//a[text()]",
-        ]
-        for selector in text_selectors:
-            try:
-                elements = driver.find_elements(By.XPATH, selector)
-                for element in elements:
-                    if element.is_displayed():
-                        text = element.text.strip()
-                        if text.isdigit():
-                            page_num = int(text)
-                            if page_num not in page_numbers:
-                                page_numbers.append(page_num)
-            except Exception:
-                continue
-        if page_numbers:
-            page_numbers.sort()
+        for _, elements in text_scans:
+            for _, text, _, _, _, _, _ in elements:
+                if text.isdigit():
+                    found.add(int(text))
+        if found:
+            page_numbers = sorted(found)
+            ctx._max_page = page_numbers[-1]
             logger.info(f"Found page numbers from text: {page_numbers}")
             if ctx.max_pages and len(page_numbers) > ctx.max_pages:
                 page_numbers = page_numbers[:ctx.max_pages]
@@ -605,116 +1239,87 @@ def get_available_page_numbers(ctx) -> List[int]:
         return []
 
 
+def page_reached(page_num: int):
+    """WebDriverWait condition: the listing shows `page_num`, by URL or by the selected MUI button.
+
+    Each poll is a single PAGE_REACHED_JS call rather than a current_url read plus a lookup.
+    """
+    def condition(driver) -> bool:
+        return bool(driver.execute_script(PAGE_REACHED_JS, page_num))
+
+    return condition
+
+
+def navigate_by_url(ctx, page_num: int) -> bool:
+    """Load `page_num` by setting the `page` query parameter of the current URL.
+
+    Returns True once the new page shows tasker cards for that page, False if it does
+    not within the wait (e.g. the listing does not paginate by URL).
+    """
+    logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
+    driver = ctx.driver
+    try:
+        driver.get(build_page_url(driver.current_url, page_num))
+        WebDriverWait(driver, 8, poll_frequency=0.2).until(
+            lambda d: d.execute_script(URL_PAGE_READY_JS, page_num, TASKER_CARD_CSS)
+        )
+        logger.info(f"Navigated to page {page_num} by URL")
+        return True
+    except TimeoutException:
+        logger.debug(f"Page {page_num} did not render tasker cards when loaded by URL")
+    except Exception as e:
+        logger.debug(f"Could not load page {page_num} by URL: {e}")
+    return False
+
+
 def navigate_to_page_number(ctx, page_num: int) -> bool:
     logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
     driver = ctx.driver
+    # Fast path: the listing paginates by query string, so skip the pagination controls
+    if navigate_by_url(ctx, page_num):
+        return True
     try:
-        mui_page_selectors = [
-            f"//button[contains(@class, 'MuiPaginationItem-page') and text()='{page_num}']",
-            f"//button[contains(@class, 'MuiPaginationItem-root') and text()='{page_num}']",
-        ]
-        for selector in mui_page_selectors:
-            try:
-                elements = driver.find_elements(By.XPATH, selector)
-                for element in elements:
-                    if element.is_displayed() and element.is_enabled():
-                        element_class = element.get_attribute('class') or ''
-                        aria_current = element.get_attribute('aria-current') or ''
-                        if (
-                            'selected' in element_class.lower()
-                            or 'current' in element_class.lower()
-                            or 'active' in element_class.lower()
-                            or aria_current == 'page'
-                        ):
-                            logger.debug(f"Skipping current page button for page {page_num}")
-                            continue
-                        try:
-                            logger.info(f"Trying JavaScript click for MUI page {page_num} button")
-                            driver.execute_script("arguments[0].click();", element)
-                            time.sleep(4)
-                            current_page_elements = driver.find_elements(
-                                By.XPATH,
-                                f"//button[contains(@class, 'MuiPaginationItem') and (contains(@class, 'selected') or @aria-current='page') and text()='{page_num}']",
-                            )
-                            if current_page_elements:
-                                logger.info(f"Successfully navigated to page {page_num} via JavaScript (verified by selected state)")
-                                return True
-                            current_url = driver.current_url
-                            if f"page={page_num}" in current_url:
-                                logger.info(f"Successfully navigated to page {page_num} via JavaScript (verified by URL)")
-                                return True
-                        except Exception as js_error:
-                            logger.debug(f"JavaScript click failed: {js_error}")
-                        logger.info(
-                            f"Trying regular click for MUI page {page_num} button with selector: {selector}"
-                        )
-                        element.click()
-                        time.sleep(ctx.__dict__.get('SLEEP_CONTINUE_BUTTON', 2))
-                        current_url = driver.current_url
-                        if f"page={page_num}" in current_url:
-                            logger.info(f"Successfully navigated to page {page_num}")
-                            return True
-                        else:
-                            time.sleep(2)
-                            current_url = driver.current_url
-                            if f"page={page_num}" in current_url:
-                                logger.info(
-                                    f"Successfully navigated to page {page_num} after additional wait"
-                                )
-                                return True
-                            else:
-                                try:
-                                    current_page_elements = driver.find_elements(
-                                        By.XPATH,
-                                        f"//button[contains(@class, 'MuiPaginationItem') and (contains(@class, 'selected') or @aria-current='page') and text()='{page_num}']",
-                                    )
-                                    if current_page_elements:
-                                        logger.info(
-                                            f"Successfully navigated to page {page_num} (verified by selected state)"
-                                        )
-                                        return True
-                                except Exception:
-                                    pass
-                                logger.debug(
-                                    f"Navigation to page {page_num} may have failed - URL is {current_url}"
-                                )
-            except Exception as e:
-                logger.debug(f"Error with MUI page selector {selector}: {e}")
-                continue
+        # CSS for attribute matches; XPath only for the exact-text links
         page_selectors = [
-            f"//nav//a[contains(@href, 'page={page_num}')]",
-            f"//div[contains(@class, 'pagination')]//a[contains(@href, 'page={page_num}')]",
-            f"//ul[contains(@class, 'pagination')]//a[contains(@href, 'page={page_num}')]",
-            f"//div[contains(@class, 'page')]//a[contains(@href, 'page={page_num}')]",
-            f"//nav//a[text()='{page_num}']",
-            f"//div[contains(@class, 'pagination')]//a[text()='{page_num}']",
-            f"//ul[contains(@class, 'pagination')]//a[text()='{page_num}']",
-            f"//nav//button[contains(@aria-label, 'Page {page_num}')]",
-            f"//div[contains(@class, 'pagination')]//button[contains(@aria-label, 'Page {page_num}')]",
+            (By.CSS_SELECTOR, f"nav a[href*='page={page_num}']"),
+            (By.CSS_SELECTOR, f"div[class*='pagination'] a[href*='page={page_num}']"),
+            (By.CSS_SELECTOR, f"ul[class*='pagination'] a[href*='page={page_num}']"),
+            (By.CSS_SELECTOR, f"div[class*='page'] a[href*='page={page_num}']"),
+            (By.XPATH, f"//nav//a[text()='{page_num}']"),
+            (By.XPATH, f"//div[contains(@class, 'pagination')]//a[text()='{page_num}']"),
+            (By.XPATH, f"//ul[contains(@class, 'pagination')]//a[text()='{page_num}']"),
+            (By.CSS_SELECTOR, f"nav button[aria-label*='Page {page_num}']"),
+            (By.CSS_SELECTOR, f"div[class*='pagination'] button[aria-label*='Page {page_num}']"),
         ]
-        for selector in page_selectors:
+        # One script finds every clickable candidate (current/disabled buttons already skipped)
+        candidates = driver.execute_script(PAGE_BUTTON_CANDIDATES_JS, page_num, page_selectors)
+        for kind, element, selector in candidates:
+            if kind == 'link':
+                logger.info(f"Clicking page {page_num} button with selector: {selector}")
+                element.click()
+                return True
             try:
-                elements = driver.find_elements(By.XPATH, selector)
-                for element in elements:
-                    if element.is_displayed() and element.is_enabled():
-                        element_class = element.get_attribute('class') or ''
-                        aria_current = element.get_attribute('aria-current') or ''
-                        if (
-                            'disabled' in element_class.lower()
-                            or 'current' in element_class.lower()
-                            or 'active' in element_class.lower()
-                            or aria_current == 'page'
-                        ):
-                            logger.debug(
-                                f"Skipping current/disabled page button for page {page_num}"
-                            )
-                            continue
-                        logger.info(f"Clicking page {page_num} button with selector: {selector}")
-                        element.click()
-                        return True
+                logger.info(f"Trying JavaScript click for MUI page {page_num} button")
+                driver.execute_script("arguments[0].click();", element)
+                WebDriverWait(driver, 4, poll_frequency=0.2).until(page_reached(page_num))
+                logger.info(f"Successfully navigated to page {page_num} via JavaScript")
+                return True
+            except TimeoutException:
+                logger.debug(f"JavaScript click did not reach page {page_num}")
+            except Exception as js_error:
+                logger.debug(f"JavaScript click failed: {js_error}")
+            try:
+                logger.info(f"Trying regular click for MUI page {page_num} button with selector: {selector}")
+                element.click()
+                WebDriverWait(
+                    driver, ctx.__dict__.get('SLEEP_CONTINUE_BUTTON', 2) + 2, poll_frequency=0.2
+                ).until(page_reached(page_num))
+                logger.info(f"Successfully navigated to page {page_num}")
+                return True
+            except TimeoutException:
+                logger.debug(f"Navigation to page {page_num} may have failed - URL is {driver.current_url}")
             except Exception as e:
-                logger.debug(f"Error with page selector {selector}: {e}")
-                continue
+                logger.debug(f"Error with MUI page button for page {page_num}: {e}")
         logger.debug(f"No clickable page {page_num} button found")
         return False
     except Exception as e:
@@ -722,89 +1327,73 @@ def navigate_to_page_number(ctx, page_num: int) -> bool:
         return False
 
 
+@lru_cache(maxsize=64)
+def total_pages_patterns(current_page: int) -> Tuple[re.Pattern, ...]:
+    """Compiled "<current_page> of N" patterns, most specific first, ending with _OF_PAGES_RE."""
+    return (
+        re.compile(rf'Page {current_page} of (\d+)', re.IGNORECASE),
+        re.compile(rf'{current_page} of (\d+)', re.IGNORECASE),
+        _OF_PAGES_RE,
+    )
+
+
 def check_for_next_page(ctx) -> bool:
     logger = ctx.__dict__.get('logger') or __import__('logging').getLogger(__name__)
     driver = ctx.driver
     try:
-        next_page_selectors = [
-            "//a[contains(@aria-label, 'Next')]",
-            "//button[contains(@aria-label, 'Next')]",
-            "//a[contains(text(), 'Next')]",
-            "//button[contains(text(), 'Next')]",
-            "//a[contains(@class, 'next')]",
-            "//button[contains(@class, 'next')]",
-            "//a[@rel='next']",
-            "//button[@rel='next']",
-            "//a[contains(@href, 'page=')][last()]",
-            "//nav//a[last()]",
-            "//div[contains(@class, 'pagination')]//a[last()]",
-        ]
-        for selector in next_page_selectors:
-            try:
-                next_elements = driver.find_elements(By.XPATH, selector)
-                for element in next_elements:
-                    if element.is_displayed() and element.is_enabled():
-                        element_text = element.text.lower()
-                        element_class = element.get_attribute('class') or ''
-                        element_href = element.get_attribute('href') or ''
-                        if 'disabled' in element_class.lower():
-                            continue
-                        if (
-                            'next' in element_text
-                            or 'next' in element_class.lower()
-                            or 'page=' in element_href
-                        ):
-                            logger.debug(f"Found next page indicator: {selector}")
-                            return True
-            except Exception:
-                continue
+        # Once get_available_page_numbers has seen the last page, the URL alone answers this
+        max_page = ctx.__dict__.get('_max_page')
+        if max_page is not None:
+            page_match = _PAGE_RE.search(driver.current_url)
+            return (int(page_match.group(1)) if page_match else 1) < max_page
+        # Next-page controls and page links are read in one batched scan
+        scans = scan_elements(ctx, NEXT_PAGE_COMPOUND_SELECTORS + PAGE_LINK_SELECTORS)
+        next_scans = scans[:len(NEXT_PAGE_COMPOUND_SELECTORS)]
+        page_link_scans = scans[len(NEXT_PAGE_COMPOUND_SELECTORS):]
+        for (_, selector), (_, elements) in zip(NEXT_PAGE_COMPOUND_SELECTORS, next_scans):
+            for _, text, element_class, _, element_href, displayed, enabled in elements:
+                if not (displayed and enabled):
+                    continue
+                element_class = element_class.lower()
+                if 'disabled' in element_class:
+                    continue
+                if 'next' in text.lower() or 'next' in element_class or 'page=' in element_href:
+                    logger.debug(f"Found next page indicator: {selector}")
+                    return True
+        # current_url and page_source are each one round-trip (page_source serializes the
+        # whole DOM), so read them at most once for the fallbacks below
+        current_url = driver.current_url
+        page_source = None
         try:
-            current_url = driver.current_url
             if 'page=' in current_url:
-                page_match = re.search(r"page=(\d+)", current_url)
+                page_match = _PAGE_RE.search(current_url)
                 if page_match:
                     current_page = int(page_match.group(1))
                     page_source = driver.page_source
-                    total_pages_patterns = [
-                        rf'Page {current_page} of (\d+)',
-                        rf'{current_page} of (\d+)',
-                        rf'page {current_page} of (\d+)',
-                        r'of (\d+) pages?'
-                    ]
-                    for pattern in total_pages_patterns:
-                        match = re.search(pattern, page_source, re.IGNORECASE)
+                    for pattern in total_pages_patterns(current_page):
+                        match = pattern.search(page_source)
                         if match:
                             total_pages = int(match.group(1))
                             return current_page < total_pages
         except Exception:
             pass
         try:
-            page_number_selectors = [
-                "//nav//a[contains(@href, 'page=')]",
-                "//div[contains(@class, 'pagination')]//a[contains(@href, 'page=')]",
-                "//ul[contains(@class, 'pagination')]//a[contains(@href, 'page=')]",
-            ]
-            current_url = driver.current_url
-            current_page_match = re.search(r"page=(\d+)", current_url)
+            current_page_match = _PAGE_RE.search(current_url)
             current_page = int(current_page_match.group(1)) if current_page_match else 1
-            for selector in page_number_selectors:
-                try:
-                    page_elements = driver.find_elements(By.XPATH, selector)
-                    for element in page_elements:
-                        href = element.get_attribute('href') or ''
-                        page_match = re.search(r"page=(\d+)", href)
-                        if page_match:
-                            page_num = int(page_match.group(1))
-                            if page_num > current_page:
-                                return True
-                except Exception:
-                    continue
+            for _, elements in page_link_scans:
+                for _, _, _, _, href, _, _ in elements:
+                    page_match = _PAGE_RE.search(href)
+                    if page_match:
+                        page_num = int(page_match.group(1))
+                        if page_num > current_page:
+                            return True
         except Exception:
             pass
         try:
-            page_source = driver.page_source.lower()
-            more_indicators = ['show more', 'load more', 'next page', 'page 2', 'more results']
-            if any(indicator in page_source for indicator in more_indicators):
+            if page_source is None:
+                page_source = driver.page_source
+            # One case-insensitive pass, without a lowercased copy of the whole document
+            if _MORE_RE.search(page_source):
                 return True
         except Exception:
             pass
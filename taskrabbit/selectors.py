@@ -1,45 +1,75 @@
 # Common XPath/CSS selector constants shared across modules
+from selenium.webdriver.common.by import By
 
-# Overlays and popups
-IFRAME_OVERLAY_XPATH = "//iframe[contains(@aria-label, 'Modal Overlay')]"
-IFRAME_CONTAINER_WITH_IFRAME_XPATH = "//div[contains(@class, 'box-') and .//iframe]"
+# Overlays and popups, as (By, value) locators: CSS wherever only attributes are
+# matched, XPath only for the text-based close buttons
+IFRAME_OVERLAY_SELECTORS = [
+    (By.CSS_SELECTOR, "iframe[aria-label*='Modal Overlay']"),
+    (By.CSS_SELECTOR, "div[class*='box-']:has(iframe)"),
+]
+
+# IFRAME_OVERLAY_SELECTORS as one CSS selector list, matched in a single querySelectorAll pass
+IFRAME_OVERLAY_COMPOUND_SELECTORS = [
+    (By.CSS_SELECTOR, ", ".join(value for by, value in IFRAME_OVERLAY_SELECTORS)),
+]
 
 OVERLAY_SELECTORS = [
-    "//div[contains(@class, 'fb_lightbox-overlay')]",
-    "//div[contains(@id, 'sidebar-overlay-lightbox')]",
-    "//div[contains(@class, 'overlay')]",
-    "//div[contains(@class, 'lightbox')]",
-    "//div[contains(@class, 'modal')]",
-    "//div[contains(@class, 'popup')]",
-    "//button[contains(@class, 'close')]",
-    "//div[contains(@class, 'close')]",
-    "//button[contains(@aria-label, 'close')]",
-    "//button[contains(@aria-label, 'Close')]",
-    "//span[contains(@class, 'close')]",
-    "//a[contains(@class, 'close')]",
-    "//button[text()='×']",
-    "//button[text()='X']",
-    "//span[text()='×']",
-    "//span[text()='X']",
+    (By.CSS_SELECTOR, "div[class*='fb_lightbox-overlay']"),
+    (By.CSS_SELECTOR, "div[id*='sidebar-overlay-lightbox']"),
+    (By.CSS_SELECTOR, "div[class*='overlay']"),
+    (By.CSS_SELECTOR, "div[class*='lightbox']"),
+    (By.CSS_SELECTOR, "div[class*='modal']"),
+    (By.CSS_SELECTOR, "div[class*='popup']"),
+    (By.CSS_SELECTOR, "button[class*='close']"),
+    (By.CSS_SELECTOR, "div[class*='close']"),
+    (By.CSS_SELECTOR, "button[aria-label*='close']"),
+    (By.CSS_SELECTOR, "button[aria-label*='Close']"),
+    (By.CSS_SELECTOR, "span[class*='close']"),
+    (By.CSS_SELECTOR, "a[class*='close']"),
+    (By.XPATH, "//button[text()='×']"),
+    (By.XPATH, "//button[text()='X']"),
+    (By.XPATH, "//span[text()='×']"),
+    (By.XPATH, "//span[text()='X']"),
+]
+
+# OVERLAY_SELECTORS folded into one CSS selector list and one XPath union,
+# so the browser runs two queries instead of one per selector
+OVERLAY_COMPOUND_SELECTORS = [
+    (By.CSS_SELECTOR, ", ".join(value for by, value in OVERLAY_SELECTORS if by == By.CSS_SELECTOR)),
+    (By.XPATH, " | ".join(value for by, value in OVERLAY_SELECTORS if by == By.XPATH)),
+]
+
+# Cheap presence probe run before the overlay sweep: when nothing on the page matches
+# it, no overlay is open and the per-selector matching is skipped
+OVERLAY_PRESENCE_SELECTORS = [
+    "iframe[aria-label*='Modal']",
+    "div[class*='overlay']",
+    "div[class*='lightbox']",
+    "div[class*='modal']",
+    "div[class*='popup']",
+    "[role='dialog']",
+    "[aria-modal='true']",
+    "div[style*='z-index: 999']",
 ]
 
 AGGRESSIVE_IFRAME_SELECTORS = [
-    "//iframe[contains(@id, 'lightbox')]",
-    "//iframe[contains(@class, 'lightbox')]",
-    "//iframe[contains(@id, 'modal')]",
-    "//iframe[contains(@class, 'modal')]",
-    "//iframe[contains(@aria-label, 'Modal')]",
-    "//iframe[contains(@class, 'box-')]",
+    "iframe[id*='lightbox']",
+    "iframe[class*='lightbox']",
+    "iframe[id*='modal']",
+    "iframe[class*='modal']",
+    "iframe[aria-label*='Modal']",
+    "iframe[class*='box-']",
 ]
 
+# CSS, like AGGRESSIVE_IFRAME_SELECTORS: evaluated in-browser by a single querySelectorAll in utils
 AGGRESSIVE_CONTAINER_SELECTORS = [
-    "//div[contains(@class, 'overlay')]",
-    "//div[contains(@class, 'modal')]",
-    "//div[contains(@class, 'lightbox')]",
-    "//div[contains(@class, 'popup')]",
-    "//div[contains(@style, 'position: fixed')]",
-    "//div[contains(@style, 'position:fixed')]",
-    "//div[contains(@style, 'z-index') and contains(@style, '999')]",
+    "div[class*='overlay']",
+    "div[class*='modal']",
+    "div[class*='lightbox']",
+    "div[class*='popup']",
+    "div[style*='position: fixed']",
+    "div[style*='position:fixed']",
+    "div[style*='z-index'][style*='999']",
 ]
 
 # Continue/Next buttons
@@ -54,33 +84,276 @@ CONTINUE_SELECTORS = [
     "//button[contains(text(), 'Go')]",
 ]
 
-# Visible scan selectors for potential names and rates
+# Booking flow (TaskRabbitParser)
+
+# "Book Now"/"Get Started" entry points on a category page
+BOOKING_SELECTORS = [
+    "//button[contains(text(), 'Book Now')]",
+    "//a[contains(text(), 'Book Now')]",
+    "//button[contains(text(), 'Book')]",
+    "//a[contains(text(), 'Book')]",
+    "//button[contains(text(), 'Get Started')]",
+    "//a[contains(text(), 'Get Started')]",
+]
+
+# Buttons that start the booking form, if the address step is not shown yet
+START_BOOKING_SELECTORS = [
+    "//button[contains(text(), 'Get Started')]",
+    "//button[contains(text(), 'Start Booking')]",
+    "//a[contains(text(), 'Get Started')]",
+    "//a[contains(text(), 'Start Booking')]",
+    "//button[contains(text(), 'Book Now')]",
+    "//a[contains(text(), 'Book Now')]",
+]
+
+# Street address input of the booking form, most specific first
+ADDRESS_INPUT_SELECTORS = [
+    "//input[@placeholder='Street address']",
+    "//input[@name='address']",
+    "//input[contains(@id, 'address')]",
+    "//input[@type='text']",
+    "//input[contains(@placeholder, 'address')]",
+    "//input[contains(@class, 'address')]",
+    "//input[contains(@placeholder, 'zip')]",
+    "//input[contains(@placeholder, 'location')]",
+    "//input[contains(@name, 'location')]",
+    "//textarea[contains(@placeholder, 'address')]",
+]
+
+# Continue button of the address step
+ADDRESS_CONTINUE_SELECTORS = [
+    "//button[contains(text(), 'Continue')]",
+    "//a[contains(text(), 'Continue')]",
+    "//button[contains(text(), 'Next')]",
+    "//input[@type='submit']",
+    "//button[@type='submit']",
+]
+
+# Furniture type option; "{value}" is replaced with the configured option text
+FURNITURE_TYPE_SELECTORS = [
+    # Direct text matches
+    "//button[contains(text(), '{value}')]",
+    "//label[contains(text(), '{value}')]",
+    "//div[contains(text(), '{value}')]",
+    "//span[contains(text(), '{value}')]",
+
+    # Variations with different casing
+    "//button[contains(text(), 'Both IKEA and non-IKEA')]",
+    "//button[contains(text(), 'IKEA and non-IKEA')]",
+    "//label[contains(text(), 'Both IKEA and non-IKEA')]",
+    "//label[contains(text(), 'IKEA and non-IKEA')]",
+
+    # Radio button or checkbox inputs with associated labels
+    "//input[@type='radio']/following-sibling::*[contains(text(), '{value}')]",
+    "//input[@type='checkbox']/following-sibling::*[contains(text(), '{value}')]",
+    "//input[@type='radio']/parent::*[contains(text(), '{value}')]",
+    "//input[@type='checkbox']/parent::*[contains(text(), '{value}')]",
+
+    # Value-based selections
+    "//input[@value='both']",
+    "//input[@value='both_ikea_non_ikea']",
+    "//option[contains(text(), '{value}')]",
+
+    # Fallback options
+    "//button[contains(text(), 'Both')]",
+    "//label[contains(text(), 'Both')]",
+    "//div[contains(text(), 'Both') and contains(text(), 'IKEA')]",
+]
+
+# Task size option; "{value}" is replaced with the configured option text
+SIZE_SELECTORS = [
+    # Direct text matches with full text
+    "//button[contains(text(), '{value}')]",
+    "//label[contains(text(), '{value}')]",
+    "//div[contains(text(), '{value}')]",
+    "//span[contains(text(), '{value}')]",
+
+    # Variations with different formatting
+    "//button[contains(text(), 'Medium') and contains(text(), '2-3 hrs')]",
+    "//label[contains(text(), 'Medium') and contains(text(), '2-3 hrs')]",
+    "//div[contains(text(), 'Medium') and contains(text(), '2-3 hrs')]",
+    "//span[contains(text(), 'Medium') and contains(text(), '2-3 hrs')]",
+
+    # Radio button or checkbox inputs with associated labels
+    "//input[@type='radio']/following-sibling::*[contains(text(), '{value}')]",
+    "//input[@type='checkbox']/following-sibling::*[contains(text(), '{value}')]",
+    "//input[@type='radio']/parent::*[contains(text(), '{value}')]",
+    "//input[@type='checkbox']/parent::*[contains(text(), '{value}')]",
+
+    # Value-based selections
+    "//input[@value='medium']",
+    "//input[@value='medium_2_3_hrs']",
+    "//option[contains(text(), '{value}')]",
+
+    # Fallback options
+    "//button[contains(text(), 'Medium')]",
+    "//label[contains(text(), 'Medium')]",
+    "//div[contains(text(), 'Medium') and contains(text(), 'Est')]",
+]
+
+# Task details text field
+TASK_DETAILS_SELECTORS = [
+    # Text areas and input fields for task details
+    "//textarea[contains(@placeholder, 'details')]",
+    "//textarea[contains(@placeholder, 'task')]",
+    "//textarea[contains(@placeholder, 'Tell us')]",
+    "//input[@type='text' and contains(@placeholder, 'details')]",
+    "//input[@type='text' and contains(@placeholder, 'task')]",
+    "//input[@type='text' and contains(@placeholder, 'Tell us')]",
+
+    # Generic text areas and inputs
+    "//textarea",
+    "//input[@type='text']",
+
+    # By name or id attributes
+    "//textarea[contains(@name, 'details')]",
+    "//textarea[contains(@name, 'task')]",
+    "//textarea[contains(@id, 'details')]",
+    "//textarea[contains(@id, 'task')]",
+    "//input[contains(@name, 'details')]",
+    "//input[contains(@name, 'task')]",
+    "//input[contains(@id, 'details')]",
+    "//input[contains(@id, 'task')]",
+]
+
+# Final booking button; "{value}" is replaced with the configured button text
+FINAL_BUTTON_SELECTORS = [
+    "//button[contains(text(), '{value}')]",
+    "//a[contains(text(), '{value}')]",
+    "//input[@type='submit' and contains(@value, '{value}')]",
+    "//button[contains(@aria-label, '{value}')]",
+    "//div[contains(@role, 'button') and contains(text(), '{value}')]",
+    # Fallback patterns for "See taskers & Price"
+    "//button[contains(text(), 'See taskers')]",
+    "//a[contains(text(), 'See taskers')]",
+    "//button[contains(text(), 'taskers') and contains(text(), 'Price')]",
+    "//a[contains(text(), 'taskers') and contains(text(), 'Price')]",
+]
+
+# "Not needed for task" answer of the vehicle requirements step
+VEHICLE_NOT_NEEDED_SELECTORS = [
+    "//span[contains(text(), 'Not needed for task')]",
+    "//label[contains(text(), 'Not needed for task')]",
+    "//div[contains(text(), 'Not needed for task')]",
+    "//button[contains(text(), 'Not needed for task')]",
+]
+
+# Visible scan locators for potential names and rates, (By, value) pairs searched across
+# the whole page. Class matches use CSS; XPath is kept only where a text predicate is needed.
 NAME_SELECTORS_VISIBLE_SCAN = [
-    ".//span[contains(@class, 'mui-5xjf89')]",
-    ".//button[contains(@class, 'TRTextButtonPrimary-Root') or contains(@class, 'mui-1pbxn54')]",
-    ".//button[contains(@class, 'MuiButton-textPrimary')]",
+    (By.CSS_SELECTOR, "span[class*='mui-5xjf89']"),
+    (By.CSS_SELECTOR, "button[class*='TRTextButtonPrimary-Root']"),
+    (By.CSS_SELECTOR, "button[class*='mui-1pbxn54']"),
+    (By.CSS_SELECTOR, "button[class*='MuiButton-textPrimary']"),
 ]
 
+# Only used as fused queries, so a selector whose matches are a subset of another's adds
+# nothing (a div.rate with '$' and '/hr' in its text is already a div with both)
 RATE_SELECTORS_VISIBLE_SCAN = [
-    "//div[contains(@class, 'mui-loubxv')]",
-    "//div[contains(@class, 'rate') and contains(text(), '$') and contains(text(), '/hr')]",
-    "//span[contains(text(), '$') and contains(text(), '/hr')]",
-    "//div[contains(text(), '$') and contains(text(), '/hr')]",
+    (By.CSS_SELECTOR, "div[class*='mui-loubxv']"),
+    (By.XPATH, "//span[contains(text(), '$') and contains(text(), '/hr')]"),
+    (By.XPATH, "//div[contains(text(), '$') and contains(text(), '/hr')]"),
+]
+
+
+def _fuse_locators(locators):
+    """Fold (By, value) locators into one CSS selector list and one XPath union (when present)."""
+    fused = []
+    for by, joiner in ((By.CSS_SELECTOR, ", "), (By.XPATH, " | ")):
+        values = [value for locator_by, value in locators if locator_by == by]
+        if values:
+            fused.append((by, joiner.join(values)))
+    return fused
+
+
+# The scan lists above fused per locator type, so each list costs at most two queries
+NAME_VISIBLE_SCAN_LOCATORS = _fuse_locators(NAME_SELECTORS_VISIBLE_SCAN)
+RATE_VISIBLE_SCAN_LOCATORS = _fuse_locators(RATE_SELECTORS_VISIBLE_SCAN)
+
+# Tasker cards on the listing page (CSS: matched via the browser's selector engine, not XPath)
+TASKER_CARD_ATTR = ('data-testid', 'tasker-card-mobile')  # also used to find cards in raw page HTML
+TASKER_CARD_CSS = "div[{}='{}']".format(*TASKER_CARD_ATTR)
+
+TASKER_CARD_FALLBACK_CSS = [
+    "div[class*='mui-1m4n54b']",
+    "div[data-testid*='tasker']",
+    "div[class*='tasker']",
+    "div[class*='card']",
 ]
 
-# Per-card extraction selectors
+# Per-card extraction locators, (By, value) pairs searched inside each card.
+# Class and tag matches use CSS; XPath is kept only where a text predicate is needed.
 NAME_SELECTORS_CARD = [
-    ".//button[contains(@class, 'mui-1pbxn54')]",
-    ".//button[contains(@class, 'TRTextButtonPrimary-Root')]",
-    ".//span[contains(@class, 'mui-5xjf89')]",
-    ".//h3",
-    ".//*[text()[contains(., '.') and string-length(.) < 20]]",
+    (By.CSS_SELECTOR, "button[class*='mui-1pbxn54']"),
+    (By.CSS_SELECTOR, "button[class*='TRTextButtonPrimary-Root']"),
+    (By.CSS_SELECTOR, "span[class*='mui-5xjf89']"),
+    (By.CSS_SELECTOR, "h3"),
+    (By.XPATH, ".//*[text()[contains(., '.') and string-length(.) < 20]]"),
 ]
 
+# Tried in order; the '$'-text XPath already covers every '$' span, so there is no span-only entry
 RATE_SELECTORS_CARD = [
-    ".//div[contains(@class, 'mui-loubxv')]",
-    ".//*[contains(text(), '$') and contains(text(), '/hr')]",
-    ".//*[contains(text(), '$')]",
-    ".//div[contains(@class, 'rate')]",
-    ".//span[contains(text(), '$')]",
+    (By.CSS_SELECTOR, "div[class*='mui-loubxv']"),
+    (By.XPATH, ".//*[contains(text(), '$') and contains(text(), '/hr')]"),
+    (By.XPATH, ".//*[contains(text(), '$')]"),
+    (By.CSS_SELECTOR, "div[class*='rate']"),
+]
+
+# Card XPaths are evaluated with the card as context node, so they must stay relative:
+# a bare '//' would search the whole document again from every card
+for _by, _value in NAME_SELECTORS_CARD + RATE_SELECTORS_CARD:
+    assert _by != By.XPATH or _value.startswith('.//'), f"card XPath must start with './/': {_value}"
+del _by, _value
+
+# Pagination locators, searched across the whole page in priority order
+MUI_PAGINATION_SELECTORS = [
+    (By.CSS_SELECTOR, "button[class*='MuiPaginationItem-page']"),
+    (By.CSS_SELECTOR, "button[class*='MuiPaginationItem-root']"),
+]
+
+# Links carrying a page=N query parameter inside pagination containers
+PAGE_LINK_SELECTORS = [
+    (By.CSS_SELECTOR, "nav a[href*='page=']"),
+    (By.CSS_SELECTOR, "div[class*='pagination'] a[href*='page=']"),
+    (By.CSS_SELECTOR, "ul[class*='pagination'] a[href*='page=']"),
+]
+
+PAGINATION_SELECTORS = PAGE_LINK_SELECTORS + [
+    (By.CSS_SELECTOR, "div[class*='page'] a[href*='page=']"),
+    (By.CSS_SELECTOR, "nav button[aria-label*='Page']"),
+    (By.CSS_SELECTOR, "div[class*='pagination'] button[aria-label*='Page']"),
+    (By.CSS_SELECTOR, "a[href*='page=']"),
+    (By.CSS_SELECTOR, "button[aria-label*='Page']"),
+    (By.CSS_SELECTOR, "div[class*='page'] a"),
+    (By.CSS_SELECTOR, "nav a"),
+    (By.CSS_SELECTOR, "div[class*='pagination'] a"),
+    (By.CSS_SELECTOR, "ul[class*='pagination'] a"),
+    (By.CSS_SELECTOR, "span[class*='page'] a"),
+    (By.CSS_SELECTOR, "div[data-testid*='page'] a"),
+    (By.CSS_SELECTOR, "div[data-testid*='pagination'] a"),
+]
+
+# "Next page" controls; the [last()] lookups stay XPath (no CSS equivalent)
+NEXT_PAGE_SELECTORS = [
+    (By.CSS_SELECTOR, "a[aria-label*='Next']"),
+    (By.CSS_SELECTOR, "button[aria-label*='Next']"),
+    (By.XPATH, "//a[contains(text(), 'Next')]"),
+    (By.XPATH, "//button[contains(text(), 'Next')]"),
+    (By.CSS_SELECTOR, "a[class*='next']"),
+    (By.CSS_SELECTOR, "button[class*='next']"),
+    (By.CSS_SELECTOR, "a[rel='next']"),
+    (By.CSS_SELECTOR, "button[rel='next']"),
+    (By.XPATH, "//a[contains(@href, 'page=')][last()]"),
+    (By.XPATH, "//nav//a[last()]"),
+    (By.XPATH, "//div[contains(@class, 'pagination')]//a[last()]"),
+]
+
+# NEXT_PAGE_SELECTORS folded into one CSS selector list and one XPath union,
+# so the browser runs two queries instead of one per selector
+NEXT_PAGE_COMPOUND_SELECTORS = _fuse_locators(NEXT_PAGE_SELECTORS)
+
+PAGINATION_TEXT_SELECTORS = [
+    (By.XPATH, "//nav//a[text()]"),
+    (By.XPATH, "//div[contains(@class, 'pagination')]//a[text()]"),
+    (By.XPATH, "//ul[contains(@class, 'pagination')]//a[text()]"),
 ]
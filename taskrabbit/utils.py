@@ -1,128 +1,310 @@
-from typing import Dict
+from typing import Dict, List, Optional
 import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    TimeoutException,
+    WebDriverException,
+)
 from .selectors import (
-    IFRAME_OVERLAY_XPATH,
-    IFRAME_CONTAINER_WITH_IFRAME_XPATH,
-    OVERLAY_SELECTORS,
+    IFRAME_OVERLAY_COMPOUND_SELECTORS,
+    OVERLAY_COMPOUND_SELECTORS,
+    OVERLAY_PRESENCE_SELECTORS,
     AGGRESSIVE_IFRAME_SELECTORS,
     AGGRESSIVE_CONTAINER_SELECTORS,
     CONTINUE_SELECTORS,
 )
 
+_OVERLAY_PRESENCE_CSS = ', '.join(OVERLAY_PRESENCE_SELECTORS)
 
-def close_overlays_and_popups(driver, wait: WebDriverWait, logger, sleeps: Dict[str, float]) -> None:
-    """Close common overlays/popups that can block interactions."""
-    SLEEP_OVERLAY_REMOVAL = sleeps.get('SLEEP_OVERLAY_REMOVAL', 0.5)
-    # Handle iframe overlays
+# Shared by the overlay scripts below: eachShown(locators, action) applies `action` to every
+# element matched by the Selenium-style [by, value] `locators` ('css selector' via
+# querySelectorAll, anything else as XPath) that is still attached and displayed when its
+# turn comes, and returns how many it handled (an action that throws is not counted).
+_EACH_SHOWN_JS = """
+function shown(node) {
+    if (node.nodeType !== 1 || !node.isConnected || !node.getClientRects().length) return false;
+    var style = window.getComputedStyle(node);
+    return style.visibility !== 'hidden' && style.opacity !== '0';
+}
+function matches(locator) {
+    if (locator[0] === 'css selector') return Array.prototype.slice.call(document.querySelectorAll(locator[1]));
+    var result = document.evaluate(locator[1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+    return nodes;
+}
+function eachShown(locators, action) {
+    var handled = 0;
+    locators.forEach(function (locator) {
+        var nodes;
+        try {
+            nodes = matches(locator);
+        } catch (err) {
+            return;
+        }
+        nodes.forEach(function (node) {
+            if (!shown(node)) return;
+            try {
+                action(node);
+                handled++;
+            } catch (err) {}
+        });
+    });
+    return handled;
+}
+"""
+
+# Returns 0 at once when nothing matches the CSS selector in arguments[2]; otherwise
+# removes the displayed iframe overlays and containers matched by the locators in
+# arguments[0], then clicks every displayed close control matched by arguments[1].
+# Returns how many elements were removed or clicked.
+CLOSE_OVERLAYS_JS = _EACH_SHOWN_JS + """
+if (!document.querySelector(arguments[2])) return 0;
+return eachShown(arguments[0], function (node) { node.remove(); })
+    + eachShown(arguments[1], function (node) { node.click(); });
+"""
+
+# Removes, in one querySelectorAll sweep, the displayed iframes matching the CSS selector in
+# arguments[0] and the rendered containers matching the CSS selector in arguments[1] that
+# are larger than 500x300, then every fixed-position element with a z-index above 1000.
+# Returns how many were removed.
+REMOVE_OVERLAYS_AGGRESSIVELY_JS = _EACH_SHOWN_JS + """
+var iframeCss = arguments[0];
+var removed = 0;
+document.querySelectorAll(iframeCss + ', ' + arguments[1]).forEach(function (e) {
+    if (!e.isConnected || !e.getClientRects().length) return;
+    if (e.matches(iframeCss)) {
+        if (!shown(e)) return;
+    } else {
+        var r = e.getBoundingClientRect();
+        if (r.width <= 500 || r.height <= 300) return;
+    }
+    e.remove();
+    removed++;
+});
+var elements = document.querySelectorAll('*');
+for (var i = 0; i < elements.length; i++) {
+    var style = window.getComputedStyle(elements[i]);
+    if (parseInt(style.zIndex) > 1000 && style.position === 'fixed') {
+        elements[i].remove();
+        removed++;
+    }
+}
+return removed;
+"""
+
+# Returns the element to click for the option label in arguments[0]: its parent
+# when that parent is a label/div wrapping an input, otherwise the label itself.
+# The target is scrolled into view in the same call.
+CLICK_TARGET_JS = """
+var element = arguments[0];
+var parent = element.parentElement;
+var target = element;
+if (parent && (parent.tagName === 'LABEL' || parent.tagName === 'DIV') && parent.innerHTML.indexOf('input') !== -1) {
+    target = parent;
+}
+target.scrollIntoView(true);
+return target;
+"""
+
+# Returns [element, index] for the first displayed, enabled element matched by the XPaths
+# in arguments[0] and the index of the XPath that matched it, trying them in order
+# (selector priority wins over document order), or null
+FIRST_INTERACTABLE_JS = """
+var xpaths = arguments[0];
+for (var i = 0; i < xpaths.length; i++) {
+    var result = document.evaluate(xpaths[i], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var j = 0; j < result.snapshotLength; j++) {
+        var node = result.snapshotItem(j);
+        if (node.nodeType !== 1 || node.disabled || !node.getClientRects().length) continue;
+        var style = window.getComputedStyle(node);
+        if (style.visibility !== 'hidden' && style.opacity !== '0') return [node, i];
+    }
+}
+return null;
+"""
+
+# Returns [tag, text, value, displayed] for the first arguments[0] buttons, labels, radio
+# buttons and checkboxes on the page, in document order (for "available options" logs)
+OPTION_CONTROLS_JS = """
+var controls = document.querySelectorAll("button, label, input[type='radio'], input[type='checkbox']");
+return Array.prototype.slice.call(controls, 0, arguments[0]).map(function (e) {
+    return [e.tagName.toLowerCase(), (e.innerText || '').trim(), e.getAttribute('value'), e.getClientRects().length > 0];
+});
+"""
+
+# Sets the value of the field in arguments[0] to arguments[1] and fires input/change events,
+# so framework listeners see the edit (fallback when typing into the field fails)
+SET_VALUE_JS = """
+var field = arguments[0];
+field.focus();
+field.value = arguments[1];
+field.dispatchEvent(new Event('input', {bubbles: true}));
+field.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+# Returns [tag, placeholder, name, id, displayed] for the first arguments[0] text inputs
+# and textareas on the page, in document order (for "available text inputs" logs)
+TEXT_INPUTS_JS = """
+var inputs = document.querySelectorAll("textarea, input[type='text']");
+return Array.prototype.slice.call(inputs, 0, arguments[0]).map(function (e) {
+    return [e.tagName.toLowerCase(), e.getAttribute('placeholder'), e.getAttribute('name'), e.id, e.getClientRects().length > 0];
+});
+"""
+
+# True when the page's rendered text contains any of the lowercase strings in arguments[0]
+PAGE_TEXT_CONTAINS_ANY_JS = """
+var text = (document.body ? document.body.innerText : '').toLowerCase();
+return arguments[0].some(function (s) { return text.indexOf(s) !== -1; });
+"""
+
+# Returns [url, title, links] where links holds [text (first 50 chars), href] for the
+# first arguments[0] links on the page (for debug dumps of the current step)
+PAGE_SUMMARY_JS = """
+var links = Array.prototype.slice.call(document.links, 0, arguments[0]).map(function (a) {
+    return [(a.innerText || '').trim().slice(0, 50), a.href];
+});
+return [location.href, document.title, links];
+"""
+
+
+def find_first_interactable(driver, xpaths: List[str], cache: Optional[Dict[str, str]] = None,
+                            key: Optional[str] = None):
+    """Return the first displayed and enabled element matching `xpaths` (in priority order), or None.
+
+    All selectors are evaluated in a single execute_script call. With a `cache` dict and a
+    `key` for the step, the XPath that matched last time is tried first (so a hit stops at
+    one XPath evaluation) and the winning XPath is remembered for the next call.
+    """
+    use_cache = cache is not None and key is not None
+    if use_cache:
+        cached = cache.get(key)
+        if cached in xpaths:
+            xpaths = [cached] + [xpath for xpath in xpaths if xpath != cached]
+    found = driver.execute_script(FIRST_INTERACTABLE_JS, xpaths)
+    if not found:
+        return None
+    element, index = found
+    if use_cache:
+        cache[key] = xpaths[index]
+    return element
+
+
+def wait_for_first_interactable(wait: WebDriverWait, xpaths: List[str], cache: Optional[Dict[str, str]] = None,
+                                key: Optional[str] = None):
+    """Wait (with `wait`'s timeout) until one of `xpaths` matches a displayed, enabled element.
+
+    Every poll checks all selectors in one find_first_interactable call, so a miss costs a
+    single timeout rather than one per selector. Raises TimeoutException on a miss.
+    `cache` and `key` are passed through to find_first_interactable.
+    """
+    return wait.until(lambda driver: find_first_interactable(driver, xpaths, cache, key))
+
+
+def click_element(driver, element) -> bool:
+    """Click `element`, switching straight to a JavaScript click when the native click is blocked.
+
+    Only an intercepted or non-interactable click falls back (an overlay on top, a hidden
+    input); anything else, e.g. a stale element, propagates. Returns False when the
+    JavaScript click was used.
+    """
     try:
-        iframe_overlays = driver.find_elements(By.XPATH, IFRAME_OVERLAY_XPATH)
-        for iframe in iframe_overlays:
-            if iframe.is_displayed():
-                driver.execute_script("arguments[0].remove();", iframe)
-                time.sleep(SLEEP_OVERLAY_REMOVAL)
-    except Exception:
-        pass
+        element.click()
+        return True
+    except (ElementClickInterceptedException, ElementNotInteractableException):
+        driver.execute_script("arguments[0].click();", element)
+        return False
 
-    # Handle parent containers of iframe overlays
+
+def insert_text(driver, element, text: str) -> None:
+    """Type `text` into `element` with one CDP Input.insertText call instead of a key event per character.
+
+    The field is focused first; the text arrives as real input events, so autocomplete and
+    framework listeners still fire. Falls back to send_keys where CDP is unavailable.
+    """
+    driver.execute_script("arguments[0].focus();", element)
     try:
-        iframe_containers = driver.find_elements(By.XPATH, IFRAME_CONTAINER_WITH_IFRAME_XPATH)
-        for container in iframe_containers:
-            if container.is_displayed():
-                driver.execute_script("arguments[0].remove();", container)
-                time.sleep(SLEEP_OVERLAY_REMOVAL)
-    except Exception:
-        pass
+        driver.execute_cdp_cmd("Input.insertText", {"text": text})
+    except (AttributeError, WebDriverException):
+        element.send_keys(text)
 
-    for selector in OVERLAY_SELECTORS:
-        try:
-            elements = driver.find_elements(By.XPATH, selector)
-            for element in elements:
-                if element.is_displayed():
-                    try:
-                        element.click()
-                        time.sleep(SLEEP_OVERLAY_REMOVAL)
-                    except Exception as e:
-                        try:
-                            driver.execute_script("arguments[0].click();", element)
-                            time.sleep(SLEEP_OVERLAY_REMOVAL)
-                        except Exception:
-                            logger.debug(f"Failed to close overlay with JavaScript: {e}")
-                            continue
-        except Exception as e:
-            logger.debug(f"Error with overlay selector {selector}: {e}")
-            continue
-
-    # Try ESC key
+
+def wait_for_staleness(driver, element, timeout: float) -> bool:
+    """Wait up to `timeout` seconds for `element` to leave the DOM after a click moved the flow on.
+
+    Replaces a fixed sleep: returns as soon as the step is re-rendered, and returns
+    False (without raising) when the element is still attached at the deadline.
+    """
     try:
-        driver.find_element(By.TAG_NAME, 'body').send_keys("\u001b")
-        time.sleep(SLEEP_OVERLAY_REMOVAL)
-    except Exception:
-        pass
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(EC.staleness_of(element))
+        return True
+    except TimeoutException:
+        return False
 
 
-def remove_all_overlays_aggressively(driver, wait: WebDriverWait, logger, sleeps: Dict[str, float]) -> None:
-    """Aggressively remove overlays and modals that might block interactions."""
-    SLEEP_IFRAME_REMOVAL = sleeps.get('SLEEP_IFRAME_REMOVAL', 0.5)
+def close_overlays_and_popups(driver, wait: WebDriverWait, logger, sleeps: Dict[str, float]) -> None:
+    """Close common overlays/popups that can block interactions.
 
+    Detection, removal and close-button clicks all happen in one execute_script call,
+    which stops after a single querySelector on pages without any overlay.
+    """
+    SLEEP_OVERLAY_REMOVAL = sleeps.get('SLEEP_OVERLAY_REMOVAL', 0.5)
     try:
-        for selector in AGGRESSIVE_IFRAME_SELECTORS:
-            iframes = driver.find_elements(By.XPATH, selector)
-            for iframe in iframes:
-                if iframe.is_displayed():
-                    driver.execute_script("arguments[0].remove();", iframe)
-                    time.sleep(SLEEP_IFRAME_REMOVAL)
-    except Exception:
-        pass
+        closed = driver.execute_script(
+            CLOSE_OVERLAYS_JS, IFRAME_OVERLAY_COMPOUND_SELECTORS, OVERLAY_COMPOUND_SELECTORS,
+            _OVERLAY_PRESENCE_CSS,
+        )
+    except WebDriverException as e:
+        logger.debug(f"Error closing overlays: {e}")
+        return
 
+    # Try ESC key only when something was actually dismissed; on clean pages it is a wasted round-trip
+    if not closed:
+        return
+    logger.debug(f"Closed {closed} overlays")
     try:
-        for selector in AGGRESSIVE_CONTAINER_SELECTORS:
-            containers = driver.find_elements(By.XPATH, selector)
-            for container in containers:
-                if container.is_displayed():
-                    try:
-                        rect = container.rect
-                        if rect.get('width', 0) > 500 and rect.get('height', 0) > 300:
-                            driver.execute_script("arguments[0].remove();", container)
-                            time.sleep(SLEEP_IFRAME_REMOVAL)
-                    except Exception as e:
-                        logger.debug(f"Error removing element: {e}")
-                        continue
-    except Exception:
+        driver.find_element(By.TAG_NAME, 'body').send_keys("\u001b")
+    except WebDriverException:
         pass
+    # One settle pause for the dismiss animations, instead of one per closed overlay
+    time.sleep(SLEEP_OVERLAY_REMOVAL)
+
 
+def remove_all_overlays_aggressively(driver, wait: WebDriverWait, logger, sleeps: Dict[str, float]) -> None:
+    """Aggressively remove overlays and modals that might block interactions."""
+    SLEEP_IFRAME_REMOVAL = sleeps.get('SLEEP_IFRAME_REMOVAL', 0.5)
+
+    # Iframes, large containers and high z-index fixed layers are removed in one round-trip
     try:
-        driver.execute_script(
-            """
-            var elements = document.querySelectorAll('*');
-            for (var i = 0; i < elements.length; i++) {
-                var style = window.getComputedStyle(elements[i]);
-                var zIndex = parseInt(style.zIndex);
-                if (zIndex > 1000 && style.position === 'fixed') {
-                    elements[i].remove();
-                }
-            }
-            """
+        removed = driver.execute_script(
+            REMOVE_OVERLAYS_AGGRESSIVELY_JS,
+            ', '.join(AGGRESSIVE_IFRAME_SELECTORS),
+            ', '.join(AGGRESSIVE_CONTAINER_SELECTORS),
         )
-    except Exception:
-        pass
+        if removed:
+            logger.debug(f"Removed {removed} overlay elements")
+            time.sleep(SLEEP_IFRAME_REMOVAL)
+    except WebDriverException as e:
+        logger.debug(f"Error removing overlays: {e}")
 
     close_overlays_and_popups(driver, wait, logger, sleeps)
 
 
-def click_continue_button(driver, wait: WebDriverWait, sleeps: Dict[str, float]) -> bool:
-    """Click continue/next buttons with multiple selectors."""
+def click_continue_button(driver, wait: WebDriverWait, sleeps: Dict[str, float],
+                          cache: Optional[Dict[str, str]] = None) -> bool:
+    """Click continue/next buttons with multiple selectors (the last winner first, given a `cache`)."""
     SLEEP_CONTINUE_BUTTON = sleeps.get('SLEEP_CONTINUE_BUTTON', 2)
 
-    for selector in CONTINUE_SELECTORS:
-        try:
-            continue_btn = wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-            continue_btn.click()
-            time.sleep(SLEEP_CONTINUE_BUTTON)
-            return True
-        except TimeoutException:
-            continue
-    return False
+    try:
+        continue_btn = wait_for_first_interactable(wait, CONTINUE_SELECTORS, cache, 'continue')
+    except TimeoutException:
+        return False
+    # A blocked native click (e.g. a late overlay) falls back to a JavaScript click
+    click_element(driver, continue_btn)
+    # SLEEP_CONTINUE_BUTTON only caps the wait for the next step to replace this one
+    wait_for_staleness(driver, continue_btn, SLEEP_CONTINUE_BUTTON)
+    return True
@@ -8,25 +8,61 @@ and hourly rates to CSV files organized by category.
 Supports dynamic pagination to capture taskers from multiple pages.
 """
 
-import time
+import atexit
 import csv
+import json
 import logging
 import os
+import re
+import shelve
+import threading
 from datetime import datetime
-from typing import List, Dict
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Iterable, Tuple
 from taskrabbit.categories import CATEGORIES
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import (
+    ElementNotInteractableException,
+    ElementClickInterceptedException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from taskrabbit.utils import (
     close_overlays_and_popups as utils_close_overlays_and_popups,
     remove_all_overlays_aggressively as utils_remove_all_overlays_aggressively,
     click_continue_button as utils_click_continue_button,
+    click_element,
+    insert_text,
+    find_first_interactable,
+    wait_for_first_interactable,
+    wait_for_staleness,
+    CLICK_TARGET_JS,
+    OPTION_CONTROLS_JS,
+    PAGE_TEXT_CONTAINS_ANY_JS,
+    PAGE_SUMMARY_JS,
+    SET_VALUE_JS,
+    TEXT_INPUTS_JS,
 )
 from taskrabbit import scraper as scraper
+from taskrabbit.pool import DriverPool
+from taskrabbit.selectors import (
+    BOOKING_SELECTORS,
+    START_BOOKING_SELECTORS,
+    ADDRESS_INPUT_SELECTORS,
+    ADDRESS_CONTINUE_SELECTORS,
+    FURNITURE_TYPE_SELECTORS,
+    SIZE_SELECTORS,
+    TASK_DETAILS_SELECTORS,
+    FINAL_BUTTON_SELECTORS,
+    VEHICLE_NOT_NEEDED_SELECTORS,
+)
 from taskrabbit.extraction import extract_all_visible_text as extraction_extract_all_visible_text
 
 # Configure logging
@@ -40,25 +76,231 @@ MAX_PAGES_FOR_TESTING = None     # Set to None to scan all pages, or number to l
 SLEEP_OVERLAY_REMOVAL = 0.5          # After removing overlays/popups
 SLEEP_IFRAME_REMOVAL = 0.5         # After removing iframe overlays
 SLEEP_CONTINUE_BUTTON = 2          # After clicking continue buttons
-SLEEP_PAGE_LOAD = 3                # General page loading wait
-SLEEP_SCROLL_WAIT = 1              # After scrolling elements into view
-SLEEP_ADDRESS_INPUT = 1.5            # After entering address
 SLEEP_ADDRESS_CONTINUE = 1.5         # After clicking continue from address
-SLEEP_FURNITURE_OPTION = 1         # After selecting furniture options
-SLEEP_SIZE_OPTION = 1              # After selecting size options
-SLEEP_TASK_DETAILS = 1             # After entering task details
-SLEEP_OPTIONS_COMPLETE = 3         # After completing all options
+SLEEP_OPTIONS_COMPLETE = 3         # Max wait for the tasker listing after completing all options
 SLEEP_PAGE_NAVIGATION = 3         # After navigating to new page
 SLEEP_CARD_LOADING = 5             # Waiting for tasker cards to load
+PROBE_WAIT = 2                     # Polling for optional elements (e.g. a start booking button)
+
+# Browser reuse across parser runs (e.g. consecutive categories in one process)
+BROWSER_POOL_SIZE = 4              # Warm browsers kept per headless/headed mode
+BROWSER_MAX_USES = 50              # Runs after which a pooled browser is replaced by a fresh one
+
+# Chrome switches that strip work the scraper never needs (GPU, extensions, audio, images, throttling)
+CHROME_LEAN_ARGS = (
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-default-apps",
+    "--mute-audio",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-features=Translate,MediaRouter",
+)
+# Requests dropped at the network layer: media, webfonts and ad/analytics hosts
+CHROME_BLOCKED_URLS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4", "*.webm",
+    "*doubleclick.net*", "*googletagmanager.com*", "*google-analytics.com*",
+    "*segment.io*", "*segment.com*",
+)
+
+# Booking-flow locator cache: the XPath that last matched each step is tried first. Each
+# parser works on its own copy and merges it back here when its run ends.
+_LOCATOR_CACHE: Dict[str, str] = {}  # Shared by every parser in the process
+_LOCATOR_CACHE_LOCK = threading.Lock()  # Guards _LOCATOR_CACHE and the locator cache file
+
+# Scraped listing pages cache (enabled with the page_cache constructor argument)
+PAGE_CACHE_TTL = 3600              # Seconds a cached page is reused before it is scraped again
+
+# CSV columns, in output order, and the getter that turns a tasker dict into a row tuple
+CSV_FIELDNAMES = ('name', 'hourly_rate', 'review_rating', 'review_count', 'furniture_tasks', 'overall_tasks', 'two_hour_minimum', 'elite_status')
+_csv_row = itemgetter(*CSV_FIELDNAMES)
+CSV_BUFFER_SIZE = 1 << 20          # Write buffer for CSV output, so rows reach the OS in large chunks
+
+# Page text (lowercased, as PAGE_TEXT_CONTAINS_ANY_JS expects) showing the furniture type question
+_FURNITURE_QUESTION_INDICATORS = tuple(indicator.lower() for indicator in (
+    "What type of furniture do you need assembled or disassembled?",
+    "What type of furniture",
+    "IKEA",
+    "furniture type",
+))
+
+# Words that rule a candidate out as a tasker name
+_NON_NAME_WORDS = ('review', 'task', 'hour', '$', '/hr', 'read', 'more', 'select', 'continue')
+# The words above as one case-insensitive alternation: a single C-level scan per candidate
+_NON_NAME_WORDS_RE = re.compile('|'.join(map(re.escape, _NON_NAME_WORDS)), re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_person_name(name: str) -> bool:
+    """Cached body of TaskRabbitParser.is_valid_person_name; the same strings recur across cards and pages."""
+    # Cheap length and shape checks first
+    if not name or len(name) < 3 or len(name) > 50:
+        return False
+    
+    # Should contain at least one space and end with a period (initial)
+    if ' ' not in name or not name.endswith('.'):
+        return False
+    
+    # Split into parts and validate structure
+    parts = name.split()
+    if len(parts) < 2:
+        return False
+    
+    # Last part should be a single letter followed by period (initial)
+    if not (len(parts[-1]) == 2 and parts[-1][0].isalpha() and parts[-1][1] == '.'):
+        return False
+    
+    # All other parts should be alphabetic (first name, middle names, etc.). Together with
+    # the initial check this covers every non-space character once, so digits and special
+    # characters are rejected here without a separate scan of the whole string
+    for part in parts[:-1]:
+        if not part.isalpha():
+            return False
+    
+    return True
+
+
+@lru_cache(maxsize=4096)
+def _is_potential_name(text: str) -> bool:
+    """Cached body of TaskRabbitParser.is_potential_name, for the same reason as _is_valid_person_name."""
+    if not text or len(text) < 3 or len(text) > 50:
+        return False
+    
+    # Should end with a period (initial)
+    if not text.endswith('.'):
+        return False
+    
+    # Should contain at least one space
+    if ' ' not in text:
+        return False
+    
+    # Should not contain obvious non-name content
+    if _NON_NAME_WORDS_RE.search(text):
+        return False
+    
+    # Should have reasonable word count (2-4 words)
+    word_count = len(text.split())
+    if word_count < 2 or word_count > 4:
+        return False
+    
+    return True
+
+
+class _SharedChromeService(Service):
+    """A ChromeDriver service started once and shared by every browser in the process.
+
+    webdriver.Chrome starts its service on construction and stops it on quit(); here
+    start() only launches chromedriver if it is not already running and stop() is a
+    no-op, so browsers come and go without respawning chromedriver. shutdown() stops it.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._start_lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._start_lock:
+            process = getattr(self, 'process', None)
+            if process is None or process.poll() is not None:
+                super().start()
+
+    def stop(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        if getattr(self, 'process', None) is not None:
+            super().stop()
+
+
+_CHROME_SERVICE = _SharedChromeService()
+
+
+def build_chrome_driver(headless: bool):
+    """Create a new Chrome WebDriver with the parser's options, bound to the shared ChromeDriver service."""
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    for arg in CHROME_LEAN_ARGS:
+        chrome_options.add_argument(arg)
+    
+    driver = webdriver.Chrome(options=chrome_options, service=_CHROME_SERVICE)
+    # Element lookups double as existence probes, so never let a miss block; waits are explicit
+    driver.implicitly_wait(0)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(CHROME_BLOCKED_URLS)})
+    except Exception as e:
+        logger.debug(f"Could not install network URL blocking: {e}")
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+def _reset_browser(driver):
+    """Clear session state before a pooled browser is handed to the next run."""
+    driver.delete_all_cookies()
+    driver.get("about:blank")
+
+
+# Warm browsers shared by every parser in the process, one pool per (role, headless) pair
+_BROWSER_POOLS: Dict[Tuple[str, bool], DriverPool] = {}
+
+
+def browser_pool(headless: bool, role: str = 'main', size: int = BROWSER_POOL_SIZE) -> DriverPool:
+    """Return the process-wide pool of `role` browsers ('main' or page 'worker') for `headless`.
+
+    The pool is created on first use and grown to hold at least `size` browsers. Page
+    workers get their own pool so they never wait on browsers held by parsers.
+    """
+    key = (role, headless)
+    pool = _BROWSER_POOLS.get(key)
+    if pool is None:
+        pool = _BROWSER_POOLS.setdefault(key, DriverPool(
+            lambda: build_chrome_driver(headless),
+            size=size,
+            reset=_reset_browser,
+            max_uses=BROWSER_MAX_USES,
+        ))
+    pool.grow(size)
+    return pool
+
+
+@atexit.register
+def _close_browser_pools():
+    for pool in _BROWSER_POOLS.values():
+        pool.close()
+    _CHROME_SERVICE.shutdown()
+
 
 class TaskRabbitParser:
-    def __init__(self, category: str = 'furniture_assembly', headless: bool = False, max_pages: int = None):
+    def __init__(self, category: str = 'furniture_assembly', headless: bool = False, max_pages: int = None,
+                 page_workers: int = 1, page_cache: str = None, locator_cache: str = None,
+                 reuse_browser: bool = True):
         """Initialize the TaskRabbit parser with Chrome WebDriver."""
         self.base_url = "https://www.taskrabbit.com"
         self.driver = None
         self.wait = None
+        self.short_wait = None
+        self.card_wait = None
+        self.button_wait = None
         self.headless = headless
+        self.reuse_browser = reuse_browser  # Borrow a warm browser from the shared pool (False = own browser, quit after run)
         self.max_pages = max_pages  # Limit number of pages to process (None = all pages)
+        self.page_workers = max(1, page_workers)  # Browsers scraping listing pages concurrently (1 = sequential)
+        self.page_cache_path = page_cache  # Shelf file caching scraped pages by URL (None = disabled)
+        self.page_cache = None
+        self.page_cache_ttl = PAGE_CACHE_TTL
+        with _LOCATOR_CACHE_LOCK:
+            self.locator_cache = dict(_LOCATOR_CACHE)  # Winning XPath per booking step, seeded from earlier runs
+        self.locator_cache_path = locator_cache  # JSON file persisting locator_cache across runs (None = memory only)
+        self._max_page = None  # Highest page number seen by get_available_page_numbers (None = unknown)
         
         # Category configuration
         if category not in CATEGORIES:
@@ -67,6 +309,8 @@ class TaskRabbitParser:
         self.category = category
         self.category_config = CATEGORIES[category]
         self.category_name = self.category_config['name']
+        # Tasker listing URL; when configured the booking flow is skipped entirely
+        self.listing_url = self.category_config.get('listing_url')
         
         # Generate CSV filename with category and timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -74,25 +318,84 @@ class TaskRabbitParser:
         self.csv_filename = f"Taskers/{category_filename}_{timestamp}.csv"
         
     def setup_driver(self):
-        """Setup Chrome WebDriver with appropriate options."""
-        chrome_options = Options()
-        if self.headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        self.wait = WebDriverWait(self.driver, 20)
+        """Take a warm Chrome WebDriver from the shared browser pool (started on first use).
+
+        With reuse_browser=False a fresh browser is started for this parser instead.
+
+        Browsers run with implicit waits disabled, so every wait is explicit: self.wait for
+        elements the flow needs, self.short_wait for quick probes of optional ones.
+        """
+        self.driver = browser_pool(self.headless).acquire() if self.reuse_browser else self.create_driver()
+        # Steps usually appear well inside the timeout, so poll often; a card re-rendered
+        # mid-poll is retried instead of failing the wait
+        self.wait = WebDriverWait(self.driver, 20, poll_frequency=0.2,
+                                  ignored_exceptions=(StaleElementReferenceException, NoSuchElementException))
+        self.short_wait = WebDriverWait(self.driver, PROBE_WAIT, poll_frequency=0.1)
+        # Built once per run and reused by every step that waits for the same kind of event
+        self.card_wait = WebDriverWait(self.driver, SLEEP_CARD_LOADING * 2)
+        self.button_wait = WebDriverWait(self.driver, SLEEP_CONTINUE_BUTTON, poll_frequency=0.1)
+    
+    def release_driver(self):
+        """Hand the browser back to the shared pool (it is quit when the process exits), or quit an own browser."""
+        if self.driver:
+            if self.reuse_browser:
+                browser_pool(self.headless).release(self.driver)
+                logger.info("Browser returned to pool")
+            else:
+                self.driver.quit()
+                logger.info("Browser closed")
+            self.driver = None
+    
+    def create_driver(self):
+        """Create a new Chrome WebDriver with the parser's options."""
+        return build_chrome_driver(self.headless)
+
+    def load_locator_cache(self):
+        """Merge locators saved by earlier runs into this parser's and the shared locator cache."""
+        try:
+            with _LOCATOR_CACHE_LOCK:
+                with open(self.locator_cache_path, encoding='utf-8') as f:
+                    saved = json.load(f)
+                _LOCATOR_CACHE.update(saved)
+            self.locator_cache.update(saved)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read locator cache {self.locator_cache_path}: {e}")
+
+    def share_locator_cache(self):
+        """Merge this run's winning locators into the cache shared by later parsers in the process."""
+        with _LOCATOR_CACHE_LOCK:
+            _LOCATOR_CACHE.update(self.locator_cache)
+
+    def save_locator_cache(self):
+        """Write the shared locator cache so the next run tries the known-good selectors first."""
+        try:
+            # Other parsers may be merging into the shared cache, so write a copy taken under the lock
+            with _LOCATOR_CACHE_LOCK:
+                snapshot = dict(_LOCATOR_CACHE)
+                with open(self.locator_cache_path, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, indent=2, sort_keys=True)
+        except OSError as e:
+            logger.warning(f"Could not write locator cache {self.locator_cache_path}: {e}")
+
+    def worker_browsers(self) -> DriverPool:
+        """Warm browsers for this parser's page workers, shared across parser runs."""
+        return browser_pool(self.headless, role='worker', size=self.page_workers)
         
     def debug_page_elements(self, description=""):
-        """Debug helper to log current page elements."""
-        # Debug output disabled to reduce terminal verbosity
-        pass
+        """Debug helper to log current page elements (only when DEBUG logging is enabled)."""
+        # Kept off the default INFO output to reduce terminal verbosity; costs nothing unless enabled
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        try:
+            url, title, links = self.driver.execute_script(PAGE_SUMMARY_JS, 10)
+        except Exception as e:
+            logger.debug("Could not summarize page (%s): %s", description, e)
+            return
+        logger.debug("Page elements (%s): url=%s title=%s", description, url, title)
+        for text, href in links:
+            logger.debug("  link %r -> %s", text, href)
     
     def close_overlays_and_popups(self):
         """Close overlays/popups via shared utils while preserving timing."""
@@ -114,7 +417,23 @@ class TaskRabbitParser:
         sleeps = {
             'SLEEP_CONTINUE_BUTTON': SLEEP_CONTINUE_BUTTON,
         }
-        return utils_click_continue_button(self.driver, self.wait, sleeps)
+        return utils_click_continue_button(self.driver, self.wait, sleeps, self.locator_cache)
+    
+    def navigate_to_listing_directly(self) -> bool:
+        """Open the tasker listing URL directly, skipping the booking flow. Returns False on failure."""
+        if not self.listing_url:
+            return False
+        
+        logger.info(f"Opening {self.category_name} tasker listing directly: {self.listing_url}")
+        try:
+            self.driver.get(self.listing_url)
+            self.close_overlays_and_popups()
+            self.card_wait.until(scraper.CARDS_PRESENT)
+            return True
+        except WebDriverException as e:
+            # TimeoutException included: no cards in time, or the URL could not be loaded at all
+            logger.warning(f"Direct listing URL did not render tasker cards, falling back to booking flow: {e}")
+            return False
     
     def navigate_to_category_page(self):
         """Navigate directly to the category page using configured URL"""
@@ -122,10 +441,9 @@ class TaskRabbitParser:
         
         # Go directly to the category page
         direct_url = self.category_config['url']
+        # get() returns once the page has loaded; the booking button lookup below polls for
+        # the button itself, so no fixed pause is needed here
         self.driver.get(direct_url)
-        time.sleep(3)
-        
-        # Loaded category page
         
         # Close any overlays that might appear even with direct navigation
         self.close_overlays_and_popups()
@@ -136,51 +454,25 @@ class TaskRabbitParser:
         # Looking for booking options
         
         # Look for Book Now or similar buttons
-        booking_selectors = [
-            "//button[contains(text(), 'Book Now')]",
-            "//a[contains(text(), 'Book Now')]",
-            "//button[contains(text(), 'Book')]",
-            "//a[contains(text(), 'Book')]",
-            "//button[contains(text(), 'Get Started')]",
-            "//a[contains(text(), 'Get Started')]"
-        ]
-        
-        book_now = None
-        for selector in booking_selectors:
-            try:
-                book_now = self.wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                logger.info(f"Found start booking button: {selector}")
-                break
-            except TimeoutException:
-                continue
+        try:
+            book_now = wait_for_first_interactable(self.wait, BOOKING_SELECTORS, self.locator_cache, 'book_now')
+            logger.info("Found start booking button")
+        except TimeoutException:
+            book_now = None
         
         if book_now:
             # Aggressive overlay removal before clicking
             self.remove_all_overlays_aggressively()
             
-            # Try multiple click methods
+            # A blocked native click goes straight to a JavaScript click (which also works off-screen)
             try:
-                book_now.click()
-                # Clicked Book Now button
-            except Exception as e:
-                logger.warning(f"Regular click failed: {e}")
-                try:
-                    # Force JavaScript click
-                    self.driver.execute_script("arguments[0].click();", book_now)
+                if not click_element(self.driver, book_now):
                     logger.info("Successfully clicked Book Now button with JavaScript click")
-                except Exception as e2:
-                    logger.warning(f"JavaScript click failed: {e2}")
-                    # Try scrolling into view and clicking
-                    try:
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", book_now)
-                        time.sleep(SLEEP_OVERLAY_REMOVAL)
-                        self.driver.execute_script("arguments[0].click();", book_now)
-                        logger.info("Successfully clicked Book Now button after scrolling")
-                    except Exception as e3:
-                        logger.error(f"All click methods failed: {e3}")
-                        raise Exception("Could not click Book Now button")
+            except WebDriverException as e:
+                logger.error(f"All click methods failed: {e}")
+                raise Exception("Could not click Book Now button")
             
-            time.sleep(SLEEP_CONTINUE_BUTTON)
+            wait_for_staleness(self.driver, book_now, SLEEP_CONTINUE_BUTTON)
             self.debug_page_elements("After clicking start booking")
         else:
             logger.error("Could not find booking button")
@@ -191,51 +483,23 @@ class TaskRabbitParser:
         logger.info("Entering address details...")
         self.debug_page_elements("Before entering address")
         
-        # Check if we need to start the booking process first
-        start_booking_selectors = [
-            "//button[contains(text(), 'Get Started')]",
-            "//button[contains(text(), 'Start Booking')]",
-            "//a[contains(text(), 'Get Started')]",
-            "//a[contains(text(), 'Start Booking')]",
-            "//button[contains(text(), 'Book Now')]",
-            "//a[contains(text(), 'Book Now')]"
-        ]
-        
-        # Try to click a start booking button if present
-        for selector in start_booking_selectors:
-            try:
-                start_btn = self.driver.find_element(By.XPATH, selector)
-                if start_btn.is_displayed():
-                    logger.info(f"Found start booking button: {selector}")
-                    start_btn.click()
-                    time.sleep(SLEEP_CONTINUE_BUTTON)
-                    self.debug_page_elements("After clicking start booking")
-                    break
-            except NoSuchElementException:
-                continue
+        # Check if we need to start the booking process first: click a start booking button if present
+        try:
+            start_btn = wait_for_first_interactable(self.short_wait, START_BOOKING_SELECTORS, self.locator_cache, 'start_booking')
+        except TimeoutException:
+            start_btn = None
+        if start_btn:
+            logger.info("Found start booking button")
+            click_element(self.driver, start_btn)
+            wait_for_staleness(self.driver, start_btn, SLEEP_CONTINUE_BUTTON)
+            self.debug_page_elements("After clicking start booking")
         
         # Enter street address
-        address_selectors = [
-            "//input[@placeholder='Street address']",
-            "//input[@name='address']",
-            "//input[contains(@id, 'address')]",
-            "//input[@type='text']",
-            "//input[contains(@placeholder, 'address')]",
-            "//input[contains(@class, 'address')]",
-            "//input[contains(@placeholder, 'zip')]",
-            "//input[contains(@placeholder, 'location')]",
-            "//input[contains(@name, 'location')]",
-            "//textarea[contains(@placeholder, 'address')]"
-        ]
-        
-        address_field = None
-        for selector in address_selectors:
-            try:
-                address_field = self.wait.until(EC.presence_of_element_located((By.XPATH, selector)))
-                logger.info(f"Found address field with selector: {selector}")
-                break
-            except TimeoutException:
-                continue
+        try:
+            address_field = wait_for_first_interactable(self.wait, ADDRESS_INPUT_SELECTORS, self.locator_cache, 'address_input')
+            logger.info("Found address field")
+        except TimeoutException:
+            address_field = None
         
         if not address_field:
             logger.error("Could not find address field")
@@ -243,34 +507,22 @@ class TaskRabbitParser:
             raise Exception("Address field not found")
         
         address_field.clear()
-        address_field.send_keys("6619 10th Ave, brooklyn, 11219, NY")
-        time.sleep(SLEEP_ADDRESS_INPUT)
-        
-        # Click Continue button
-        continue_selectors = [
-            "//button[contains(text(), 'Continue')]",
-            "//a[contains(text(), 'Continue')]",
-            "//button[contains(text(), 'Next')]",
-            "//input[@type='submit']",
-            "//button[@type='submit']"
-        ]
-        
-        continue_btn = None
-        for selector in continue_selectors:
-            try:
-                continue_btn = self.wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                logger.info(f"Found Continue button with selector: {selector}")
-                break
-            except TimeoutException:
-                continue
+        insert_text(self.driver, address_field, "6619 10th Ave, brooklyn, 11219, NY")
+        
+        # Click Continue button (the lookup waits until it is displayed and enabled)
+        try:
+            continue_btn = wait_for_first_interactable(self.wait, ADDRESS_CONTINUE_SELECTORS, self.locator_cache, 'address_continue')
+            logger.info("Found Continue button")
+        except TimeoutException:
+            continue_btn = None
         
         if not continue_btn:
             logger.error("Could not find Continue button")
             self.debug_page_elements("Continue button not found")
             raise Exception("Continue button not found")
         
-        continue_btn.click()
-        time.sleep(SLEEP_ADDRESS_CONTINUE)
+        click_element(self.driver, continue_btn)
+        wait_for_staleness(self.driver, continue_btn, SLEEP_ADDRESS_CONTINUE)
         self.debug_page_elements("After clicking Continue")
         
     def select_category_options(self):
@@ -299,7 +551,12 @@ class TaskRabbitParser:
             else:
                 logger.warning(f"Unknown option type: {option_type}")
         
-        time.sleep(SLEEP_OPTIONS_COMPLETE)
+        # Wait for the listing to render rather than sleeping a fixed time; extraction waits
+        # for the cards again, so a miss here only means the debug dump comes early
+        try:
+            WebDriverWait(self.driver, SLEEP_OPTIONS_COMPLETE, poll_frequency=0.2).until(scraper.CARDS_PRESENT)
+        except TimeoutException:
+            logger.debug("Tasker cards not present yet after options selection")
         self.debug_page_elements(f"After {self.category_name} options selection")
     
     def _select_furniture_type_option(self, option_value: str):
@@ -307,16 +564,9 @@ class TaskRabbitParser:
         
         # Looking for furniture option
         
-        # First, look for the question text to confirm we're on the right page
-        question_indicators = [
-            "What type of furniture do you need assembled or disassembled?",
-            "What type of furniture",
-            "IKEA",
-            "furniture type"
-        ]
-        
-        page_text = self.driver.page_source.lower()
-        question_found = any(indicator.lower() in page_text for indicator in question_indicators)
+        # First, look for the question text to confirm we're on the right page. Searched in
+        # the browser: only a bool crosses the wire instead of the whole page source
+        question_found = self.driver.execute_script(PAGE_TEXT_CONTAINS_ANY_JS, _FURNITURE_QUESTION_INDICATORS)
         
         if question_found:
             logger.info("Found furniture type question on page")
@@ -324,91 +574,47 @@ class TaskRabbitParser:
             logger.info("Furniture type question not clearly identified, proceeding with selection")
         
         # Comprehensive selectors for the furniture type option
-        furniture_type_selectors = [
-            # Direct text matches
-            f"//button[contains(text(), '{option_value}')]",
-            f"//label[contains(text(), '{option_value}')]",
-            f"//div[contains(text(), '{option_value}')]",
-            f"//span[contains(text(), '{option_value}')]",
-            
-            # Variations with different casing
-            "//button[contains(text(), 'Both IKEA and non-IKEA')]",
-            "//button[contains(text(), 'IKEA and non-IKEA')]",
-            "//label[contains(text(), 'Both IKEA and non-IKEA')]",
-            "//label[contains(text(), 'IKEA and non-IKEA')]",
-            
-            # Radio button or checkbox inputs with associated labels
-            f"//input[@type='radio']/following-sibling::*[contains(text(), '{option_value}')]",
-            f"//input[@type='checkbox']/following-sibling::*[contains(text(), '{option_value}')]",
-            f"//input[@type='radio']/parent::*[contains(text(), '{option_value}')]",
-            f"//input[@type='checkbox']/parent::*[contains(text(), '{option_value}')]",
-            
-            # Value-based selections
-            "//input[@value='both']",
-            "//input[@value='both_ikea_non_ikea']",
-            f"//option[contains(text(), '{option_value}')]",
-            
-            # Fallback options
-            "//button[contains(text(), 'Both')]",
-            "//label[contains(text(), 'Both')]",
-            "//div[contains(text(), 'Both') and contains(text(), 'IKEA')]"
-        ]
+        furniture_type_selectors = [selector.format(value=option_value) for selector in FURNITURE_TYPE_SELECTORS]
         
-        both_option = None
-        
-        for selector in furniture_type_selectors:
-            try:
-                elements = self.driver.find_elements(By.XPATH, selector)
-                for element in elements:
-                    if element.is_displayed() and element.is_enabled():
-                        both_option = element
-                        logger.info(f"Found '{option_value}' option with selector: {selector}")
-                        logger.info(f"Element text: '{element.text}'")
-                        break
-                if both_option:
-                    break
-            except Exception:
-                continue
+        # Evaluate every selector in one round-trip; the first visible, enabled match wins
+        try:
+            both_option = find_first_interactable(self.driver, furniture_type_selectors, self.locator_cache, 'furniture_type')
+        except WebDriverException as e:
+            logger.debug(f"Furniture option lookup failed: {e}")
+            both_option = None
         
         if both_option:
+            logger.info(f"Found '{option_value}' option")
             try:
-                # Try different click methods
-                if both_option.tag_name.lower() == 'input':
-                    # For radio buttons or checkboxes, click directly
-                    both_option.click()
-                elif both_option.tag_name.lower() == 'label':
-                    # For labels, try clicking the associated input or the label itself
+                # Labels: click the associated input, or the label itself if there is none or it is hidden
+                target = both_option
+                if both_option.tag_name.lower() == 'label':
                     try:
                         input_element = both_option.find_element(By.XPATH, ".//input")
                         input_element.click()
-                    except Exception as e:
-                        logger.debug(f"Error with continue selector {selector}: {e}")
-                        both_option.click()
-                else:
-                    # For buttons or other elements
-                    both_option.click()
+                        target = None
+                    except (NoSuchElementException, ElementNotInteractableException, ElementClickInterceptedException) as e:
+                        logger.debug(f"Could not click the input inside the option label: {e}")
+                # Radio buttons, checkboxes, buttons and other elements are clicked directly
+                if target is not None and not click_element(self.driver, target):
+                    logger.info("Successfully selected furniture option using JavaScript click")
                 
-                time.sleep(SLEEP_FURNITURE_OPTION)
+                # No pause needed: click_continue_button waits for Continue to become clickable
                 logger.info(f"Successfully selected '{option_value}' option")
-            except Exception as e:
-                logger.warning(f"Failed to click furniture option: {e}")
-                # Try JavaScript click as fallback
-                try:
-                    self.driver.execute_script("arguments[0].click();", both_option)
-                    logger.info("Successfully selected furniture option using JavaScript click")
-                except Exception as e2:
-                    logger.error(f"Failed to select furniture option with JavaScript: {e2}")
+            except WebDriverException as e:
+                logger.error(f"Failed to select furniture option: {e}")
         else:
             logger.warning(f"Could not find '{option_value}' option")
-            # Debug: log available options
-            try:
-                all_buttons = self.driver.find_elements(By.XPATH, "//button | //label | //input[@type='radio'] | //input[@type='checkbox']")
-                logger.info("Available options on page:")
-                for i, btn in enumerate(all_buttons[:10]):  # Show first 10
-                    if btn.is_displayed():
-                        logger.info(f"  {i+1}. {btn.tag_name}: '{btn.text}' (value: {btn.get_attribute('value')})")
-            except Exception as e:
-                logger.info(f"Could not debug available options: {e}")
+            # Debug: log available options (first 10), read in a single script call
+            if logger.isEnabledFor(logging.INFO):
+                try:
+                    all_buttons = self.driver.execute_script(OPTION_CONTROLS_JS, 10)
+                    logger.info("Available options on page:")
+                    for i, (tag, text, value, displayed) in enumerate(all_buttons):
+                        if displayed:
+                            logger.info(f"  {i+1}. {tag}: '{text}' (value: {value})")
+                except Exception as e:
+                    logger.info(f"Could not debug available options: {e}")
             
             logger.info("Proceeding without selecting furniture type")
         
@@ -420,98 +626,50 @@ class TaskRabbitParser:
         # Looking for size option
         
         # Comprehensive selectors for the size option
-        size_selectors = [
-            # Direct text matches with full text
-            f"//button[contains(text(), '{option_value}')]",
-            f"//label[contains(text(), '{option_value}')]",
-            f"//div[contains(text(), '{option_value}')]",
-            f"//span[contains(text(), '{option_value}')]",
-            
-            # Variations with different formatting
-            "//button[contains(text(), 'Medium') and contains(text(), '2-3 hrs')]",
-            "//label[contains(text(), 'Medium') and contains(text(), '2-3 hrs')]",
-            "//div[contains(text(), 'Medium') and contains(text(), '2-3 hrs')]",
-            "//span[contains(text(), 'Medium') and contains(text(), '2-3 hrs')]",
-            
-            # Radio button or checkbox inputs with associated labels
-            f"//input[@type='radio']/following-sibling::*[contains(text(), '{option_value}')]",
-            f"//input[@type='checkbox']/following-sibling::*[contains(text(), '{option_value}')]",
-            f"//input[@type='radio']/parent::*[contains(text(), '{option_value}')]",
-            f"//input[@type='checkbox']/parent::*[contains(text(), '{option_value}')]",
-            
-            # Value-based selections
-            "//input[@value='medium']",
-            "//input[@value='medium_2_3_hrs']",
-            f"//option[contains(text(), '{option_value}')]",
-            
-            # Fallback options
-            "//button[contains(text(), 'Medium')]",
-            "//label[contains(text(), 'Medium')]",
-            "//div[contains(text(), 'Medium') and contains(text(), 'Est')]"
-        ]
-        
-        medium_option = None
+        size_selectors = [selector.format(value=option_value) for selector in SIZE_SELECTORS]
         
-        for selector in size_selectors:
-            try:
-                elements = self.driver.find_elements(By.XPATH, selector)
-                for element in elements:
-                    if element.is_displayed() and element.is_enabled():
-                        medium_option = element
-                        logger.info(f"Found '{option_value}' option with selector: {selector}")
-                        logger.info(f"Element text: '{element.text}'")
-                        break
-                if medium_option:
-                    break
-            except Exception:
-                continue
+        # Evaluate every selector in one round-trip; the first visible, enabled match wins
+        try:
+            medium_option = find_first_interactable(self.driver, size_selectors, self.locator_cache, 'size')
+        except WebDriverException as e:
+            logger.debug(f"Size option lookup failed: {e}")
+            medium_option = None
         
         if medium_option:
+            logger.info(f"Found '{option_value}' option")
             try:
-                # Try different click methods
-                if medium_option.tag_name.lower() == 'input':
-                    # For radio buttons or checkboxes, click directly
-                    medium_option.click()
-                elif medium_option.tag_name.lower() == 'label':
-                    # For labels, try clicking the associated input or the label itself
+                # Labels: click the associated input, or the label itself if there is none or it is hidden
+                target = medium_option
+                if medium_option.tag_name.lower() == 'label':
                     try:
                         input_element = medium_option.find_element(By.XPATH, ".//input")
                         input_element.click()
-                    except Exception:
-                        medium_option.click()
-                else:
-                    # For buttons or other elements
-                    medium_option.click()
+                        target = None
+                    except (NoSuchElementException, ElementNotInteractableException, ElementClickInterceptedException) as e:
+                        logger.debug(f"Could not click the input inside the option label: {e}")
+                # Radio buttons, checkboxes, buttons and other elements are clicked directly
+                if target is not None and not click_element(self.driver, target):
+                    logger.info("Successfully selected medium size option using JavaScript click")
                 
-                time.sleep(SLEEP_SIZE_OPTION)
                 logger.info(f"Successfully selected '{option_value}' option")
                 
-                # Scroll down to make sure Continue button is visible
-                logger.info("Scrolling down to reveal Continue button...")
-                self.driver.execute_script("window.scrollBy(0, 300);")
-                time.sleep(SLEEP_SCROLL_WAIT)
-                
+                # No scroll first: the click scrolls the Continue button into view itself
                 self.click_continue_button()
-            except Exception as e:
-                logger.warning(f"Failed to click medium size option: {e}")
-                # Try JavaScript click as fallback
-                try:
-                    self.driver.execute_script("arguments[0].click();", medium_option)
-                    logger.info("Successfully selected medium size option using JavaScript click")
-                    self.click_continue_button()
-                except Exception as e2:
-                    logger.error(f"Failed to select medium size option with JavaScript: {e2}")
+            except WebDriverException as e:
+                logger.error(f"Failed to select medium size option: {e}")
         else:
             logger.warning(f"Could not find '{option_value}' option")
-            # Debug: log available size options
-            try:
-                all_buttons = self.driver.find_elements(By.XPATH, "//button | //label | //input[@type='radio'] | //input[@type='checkbox']")
-                logger.info("Available size options on page:")
-                for i, btn in enumerate(all_buttons[:10]):  # Show first 10
-                    if btn.is_displayed() and ('medium' in btn.text.lower() or 'size' in btn.text.lower() or 'hrs' in btn.text.lower()):
-                        logger.info(f"  {i+1}. {btn.tag_name}: '{btn.text}' (value: {btn.get_attribute('value')})")
-            except Exception as e:
-                logger.info(f"Could not debug available size options: {e}")
+            # Debug: log available size options (among the first 10), read in a single script call
+            if logger.isEnabledFor(logging.INFO):
+                try:
+                    all_buttons = self.driver.execute_script(OPTION_CONTROLS_JS, 10)
+                    logger.info("Available size options on page:")
+                    for i, (tag, text, value, displayed) in enumerate(all_buttons):
+                        text_lower = text.lower()
+                        if displayed and ('medium' in text_lower or 'size' in text_lower or 'hrs' in text_lower):
+                            logger.info(f"  {i+1}. {tag}: '{text}' (value: {value})")
+                except Exception as e:
+                    logger.info(f"Could not debug available size options: {e}")
             
             logger.info("Proceeding without selecting size")
     
@@ -519,58 +677,19 @@ class TaskRabbitParser:
         """Enter task details in the text field."""
         # Looking for task details text box
         
-        # Comprehensive selectors for task details text input
-        task_details_selectors = [
-            # Text areas and input fields for task details
-            "//textarea[contains(@placeholder, 'details')]",
-            "//textarea[contains(@placeholder, 'task')]",
-            "//textarea[contains(@placeholder, 'Tell us')]",
-            "//input[@type='text' and contains(@placeholder, 'details')]",
-            "//input[@type='text' and contains(@placeholder, 'task')]",
-            "//input[@type='text' and contains(@placeholder, 'Tell us')]",
-            
-            # Generic text areas and inputs
-            "//textarea",
-            "//input[@type='text']",
-            
-            # By name or id attributes
-            "//textarea[contains(@name, 'details')]",
-            "//textarea[contains(@name, 'task')]",
-            "//textarea[contains(@id, 'details')]",
-            "//textarea[contains(@id, 'task')]",
-            "//input[contains(@name, 'details')]",
-            "//input[contains(@name, 'task')]",
-            "//input[contains(@id, 'details')]",
-            "//input[contains(@id, 'task')]"
-        ]
-        
-        task_details_field = None
-        
-        for selector in task_details_selectors:
-            try:
-                elements = self.driver.find_elements(By.XPATH, selector)
-                for element in elements:
-                    if element.is_displayed() and element.is_enabled():
-                        task_details_field = element
-                        # Found task details field
-                        break
-                if task_details_field:
-                    break
-            except Exception:
-                continue
+        # Evaluate every selector in one round-trip; the first visible, enabled match wins
+        try:
+            task_details_field = find_first_interactable(self.driver, TASK_DETAILS_SELECTORS, self.locator_cache, 'task_details')
+        except WebDriverException as e:
+            logger.debug(f"Task details field lookup failed: {e}")
+            task_details_field = None
         
         if task_details_field:
             try:
-                # Clear the field and enter task details
+                # Clear the field and enter task details in one insertText call (no per-key events);
+                # no scroll afterwards, the button click scrolls its target into view
                 task_details_field.clear()
-                task_details_field.send_keys(task_details)
-                time.sleep(SLEEP_TASK_DETAILS)
-                # Entered task details
-                
-                # Scroll down to make sure button is visible
-                logger.info("Scrolling down to reveal button...")
-                self.driver.execute_script("window.scrollBy(0, 300);")
-                time.sleep(SLEEP_SCROLL_WAIT)
+                insert_text(self.driver, task_details_field, task_details)
                 
                 if final_button:
                     self.click_final_button(final_button)
@@ -580,7 +699,7 @@ class TaskRabbitParser:
                 logger.warning(f"Failed to enter task details: {e}")
                 # Try JavaScript approach as fallback
                 try:
-                    self.driver.execute_script(f"arguments[0].value = '{task_details}';", task_details_field)
+                    self.driver.execute_script(SET_VALUE_JS, task_details_field, task_details)
                     # Entered task details with JavaScript
                     if final_button:
                         self.click_final_button(final_button)
@@ -590,15 +709,16 @@ class TaskRabbitParser:
                     logger.error(f"Failed to enter task details with JavaScript: {e2}")
         else:
             logger.warning("Could not find task details text field")
-            # Debug: log available text inputs
-            try:
-                all_inputs = self.driver.find_elements(By.XPATH, "//textarea | //input[@type='text']")
-                logger.info("Available text input fields on page:")
-                for i, inp in enumerate(all_inputs[:10]):  # Show first 10
-                    if inp.is_displayed():
-                        logger.info(f"  {i+1}. {inp.tag_name}: placeholder='{inp.get_attribute('placeholder')}', name='{inp.get_attribute('name')}', id='{inp.get_attribute('id')}'")
-            except Exception as e:
-                logger.info(f"Could not debug available text inputs: {e}")
+            # Debug: log available text inputs (first 10), read in a single script call
+            if logger.isEnabledFor(logging.INFO):
+                try:
+                    all_inputs = self.driver.execute_script(TEXT_INPUTS_JS, 10)
+                    logger.info("Available text input fields on page:")
+                    for i, (tag, placeholder, name, id_attr, displayed) in enumerate(all_inputs):
+                        if displayed:
+                            logger.info(f"  {i+1}. {tag}: placeholder='{placeholder}', name='{name}', id='{id_attr}'")
+                except Exception as e:
+                    logger.info(f"Could not debug available text inputs: {e}")
             
             logger.info("Proceeding without entering task details")
     
@@ -607,30 +727,15 @@ class TaskRabbitParser:
         # Looking for final button
         
         # Comprehensive selectors for the final button
-        button_selectors = [
-            f"//button[contains(text(), '{button_text}')]",
-            f"//a[contains(text(), '{button_text}')]",
-            f"//input[@type='submit' and contains(@value, '{button_text}')]",
-            f"//button[contains(@aria-label, '{button_text}')]",
-            f"//div[contains(@role, 'button') and contains(text(), '{button_text}')]",
-            # Fallback patterns for "See taskers & Price"
-            "//button[contains(text(), 'See taskers')]",
-            "//a[contains(text(), 'See taskers')]",
-            "//button[contains(text(), 'taskers') and contains(text(), 'Price')]",
-            "//a[contains(text(), 'taskers') and contains(text(), 'Price')]"
-        ]
-        
-        for selector in button_selectors:
-            try:
-                final_btn = WebDriverWait(self.driver, SLEEP_CONTINUE_BUTTON).until(
-                    EC.element_to_be_clickable((By.XPATH, selector))
-                )
-                # Found final button
-                final_btn.click()
-                time.sleep(SLEEP_CONTINUE_BUTTON)
-                return True
-            except TimeoutException:
-                continue
+        button_selectors = [selector.format(value=button_text) for selector in FINAL_BUTTON_SELECTORS]
+        
+        try:
+            final_btn = wait_for_first_interactable(self.button_wait, button_selectors, self.locator_cache, 'final_button')
+            click_element(self.driver, final_btn)
+            wait_for_staleness(self.driver, final_btn, SLEEP_CONTINUE_BUTTON)
+            return True
+        except TimeoutException:
+            pass
         
         logger.warning(f"No '{button_text}' button found, trying default continue button")
         return self.click_continue_button()
@@ -651,47 +756,24 @@ class TaskRabbitParser:
         logger.info("Selecting vehicle requirements option...")
         
         try:
-            # Wait for the vehicle requirements section to load
-            time.sleep(2)
-            
-            # Look for "Not needed for task" option
-            selectors = [
-                "//span[contains(text(), 'Not needed for task')]",
-                "//label[contains(text(), 'Not needed for task')]",
-                "//div[contains(text(), 'Not needed for task')]",
-                "//button[contains(text(), 'Not needed for task')]"
-            ]
-            
+            # Wait for the "Not needed for task" option to render instead of sleeping; all
+            # selectors and the visibility check run in one script call per poll
             option_selected = False
-            for selector in selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    if elements:
-                        element = elements[0]
-                        # Try to find the clickable parent (radio button or checkbox)
-                        clickable_element = element
-                        
-                        # Check if we need to click a parent element (radio button/checkbox)
-                        parent = element.find_element(By.XPATH, "./..")
-                        if parent.tag_name in ['label', 'div'] and 'input' in parent.get_attribute('innerHTML'):
-                            clickable_element = parent
-                        
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", clickable_element)
-                        time.sleep(1)
-                        clickable_element.click()
-                        logger.info("Selected 'Not needed for task' option")
-                        option_selected = True
-                        break
-                except Exception:
-                    continue
+            try:
+                element = wait_for_first_interactable(self.short_wait, VEHICLE_NOT_NEEDED_SELECTORS,
+                                                      self.locator_cache, 'vehicle_not_needed')
+                # Resolve the clickable parent (radio button/checkbox wrapper) and scroll to it in one call
+                clickable_element = self.driver.execute_script(CLICK_TARGET_JS, element)
+                click_element(self.driver, clickable_element)
+                logger.info("Selected 'Not needed for task' option")
+                option_selected = True
+            except Exception as e:
+                logger.debug(f"Could not select 'Not needed for task' option: {e}")
             
             if not option_selected:
                 logger.warning("Could not find 'Not needed for task' option, trying to continue anyway")
             
-            # Wait a moment for the selection to register
-            time.sleep(1)
-            
-            # Continue to next step
+            # Continue to next step (click_continue_button waits for the button to be clickable)
             self.click_continue_button()
             
         except Exception as e:
@@ -701,64 +783,19 @@ class TaskRabbitParser:
                
     def is_valid_person_name(self, name: str) -> bool:
         """Check if a string looks like a valid person name."""
-        if not name or len(name) < 3:
-            return False
-        
-        # Should contain at least one space and end with a period (initial)
-        if ' ' not in name or not name.endswith('.'):
-            return False
-        
-        # Should not contain numbers or special characters (except period)
-        if any(char.isdigit() or char in '!@#$%^&*()_+=[]{}|;:,<>?/~`' for char in name.replace('.', '')):
-            return False
-        
-        # Should be reasonable length
-        if len(name) > 50:
-            return False
-        
-        # Split into parts and validate structure
-        parts = name.split()
-        if len(parts) < 2:
-            return False
-        
-        # Last part should be a single letter followed by period (initial)
-        if not (len(parts[-1]) == 2 and parts[-1][0].isalpha() and parts[-1][1] == '.'):
-            return False
-        
-        # All other parts should be alphabetic (first name, middle names, etc.)
-        for part in parts[:-1]:
-            if not part.isalpha():
-                return False
-        
-        return True
+        return _is_valid_person_name(name)
     
     def is_potential_name(self, text: str) -> bool:
         """More flexible name validation for initial extraction."""
-        if not text or len(text) < 3 or len(text) > 50:
-            return False
-        
-        # Should end with a period (initial)
-        if not text.endswith('.'):
-            return False
-        
-        # Should contain at least one space
-        if ' ' not in text:
-            return False
-        
-        # Should not contain obvious non-name content
-        if any(word in text.lower() for word in ['review', 'task', 'hour', '$', '/hr', 'read', 'more', 'select', 'continue']):
-            return False
-        
-        # Should have reasonable word count (2-4 words)
-        word_count = len(text.split())
-        if word_count < 2 or word_count > 4:
-            return False
-        
-        return True
+        return _is_potential_name(text)
 
     def extract_tasker_data(self) -> List[Dict[str, str]]:
         """Extract tasker names and hourly rates from all paginated pages."""
         return scraper.extract_tasker_data(self)
+
+    def iter_tasker_pages(self):
+        """Yield (page_num, taskers) per listing page as each one is scraped."""
+        return scraper.iter_tasker_pages(self)
     
     def extract_all_visible_text(self):
         """Extract all visible text that might be tasker names and rates."""
@@ -792,16 +829,37 @@ class TaskRabbitParser:
         """Save extracted tasker data to CSV file."""
         logger.info(f"Saving {len(taskers)} taskers to CSV...")
         
-        with open(self.csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['name', 'hourly_rate', 'review_rating', 'review_count', 'furniture_tasks', 'overall_tasks', 'two_hour_minimum', 'elite_status']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for tasker in taskers:
-                writer.writerow(tasker)
+        with open(self.csv_filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(CSV_FIELDNAMES)
+            writer.writerows(map(_csv_row, taskers))
         
         logger.info(f"Successfully saved {len(taskers)} taskers to {self.csv_filename}")
     
+    def stream_to_csv(self, pages: Iterable[Tuple[int, List[Dict[str, str]]]]) -> int:
+        """Append each (page_num, taskers) batch to the CSV file as it arrives.
+
+        The file is created on the first non-empty page and flushed after every page,
+        so a crash mid-crawl keeps the pages already scraped. Returns the number of
+        taskers written.
+        """
+        saved = 0
+        csvfile = None
+        try:
+            for page_num, taskers in pages:
+                if csvfile is None:
+                    csvfile = open(self.csv_filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE)
+                    writer = csv.writer(csvfile)
+                    writer.writerow(CSV_FIELDNAMES)
+                writer.writerows(map(_csv_row, taskers))
+                csvfile.flush()
+                saved += len(taskers)
+                logger.info(f"Saved {len(taskers)} taskers from page {page_num} ({saved} total)")
+        finally:
+            if csvfile is not None:
+                csvfile.close()
+        return saved
+    
     def run(self):
         """Main execution method."""
         try:
@@ -811,18 +869,24 @@ class TaskRabbitParser:
             os.makedirs('Taskers', exist_ok=True)
             
             self.setup_driver()
+            if self.page_cache_path:
+                self.page_cache = shelve.open(self.page_cache_path)
+            if self.locator_cache_path:
+                self.load_locator_cache()
             
-            # Navigate through the booking flow
-            self.navigate_to_category_page()
-            self.enter_address_details()
-            self.select_category_options()
+            # Navigate through the booking flow unless the listing can be opened directly
+            if not self.navigate_to_listing_directly():
+                self.navigate_to_category_page()
+                self.enter_address_details()
+                self.select_category_options()
+                self.listing_url = self.driver.current_url
+                logger.info(f"Reached tasker listing: {self.listing_url}")
             
-            # Extract and save data from all pages
-            taskers = self.extract_tasker_data()
+            # Extract all pages, writing each one to the CSV as soon as it is scraped
+            saved = self.stream_to_csv(self.iter_tasker_pages())
             
-            if taskers:
-                self.save_to_csv(taskers)
-                logger.info(f"Successfully extracted {len(taskers)} {self.category_name} taskers to {self.csv_filename}")
+            if saved:
+                logger.info(f"Successfully extracted {saved} {self.category_name} taskers to {self.csv_filename}")
             else:
                 logger.error("No taskers found!")
                 
@@ -830,9 +894,13 @@ class TaskRabbitParser:
             logger.error(f"An error occurred: {str(e)}")
             raise
         finally:
-            if self.driver:
-                self.driver.quit()
-                logger.info("Browser closed")
+            if self.page_cache is not None:
+                self.page_cache.close()
+                self.page_cache = None
+            self.share_locator_cache()
+            if self.locator_cache_path:
+                self.save_locator_cache()
+            self.release_driver()
 
 if __name__ == "__main__":
     # Delegate to modular CLI for backward compatibility